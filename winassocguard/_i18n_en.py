@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+English UI strings. Loaded on demand by `winassocguard.i18n`.
+
+Keep keys in sync with the other language module.
+"""
+
+from __future__ import annotations
+
+from typing import Dict
+
+STRINGS: Dict[str, str] = {
+    # App / tray
+    "app_name": "WinAssocGuard",
+    "menu_open_panel": "Open Control Panel",
+    "menu_add_ext": "Add Protected Extension…",
+    "menu_capture": "Capture Current Associations as Baseline",
+    "menu_status": "Show Current Status",
+    "menu_force_restore": "Force Restore All",
+    "menu_switch_lang": "切换到中文 / Switch to Chinese",
+    "menu_exit": "Exit",
+
+    # Control Panel
+    "panel_title": "WinAssocGuard Control Panel",
+    "panel_subtitle": "Protected extensions (auto-restore when hijacked)",
+    "tab_guard": "Guard",
+    "tab_logs": "Logs",
+    "tab_settings": "Settings",
+    "panel_ext_label": "Extension:",
+    "panel_ext_placeholder": "e.g. .pdf",
+    "btn_add": "Add",
+    "btn_delete": "Remove",
+    "btn_delete_all": "Remove All",
+    "btn_refresh": "Refresh",
+    "btn_import_defaults": "Import Current Defaults",
+    "btn_import_common": "Import Extensions",
+    "btn_capture_selected": "Set Selected as Baseline",
+    "btn_set_baseline": "Set as Baseline",
+    "btn_capture_all": "Set All to Current (Baseline)",
+    "btn_restore_selected": "Restore Selected",
+    "btn_restore_all": "Restore All",
+    "btn_edit_baseline": "Edit Baseline…",
+    "btn_switch_lang": "中文/English",
+    "btn_hide": "Hide to Tray",
+    "btn_exit": "Exit",
+
+    # Table columns
+    "col_ext": "Extension",
+    "col_base": "Baseline (App)",
+    "col_curr": "Current (ProgId)",
+    "col_status": "Status",
+    "col_log_time": "Time",
+    "col_log_event": "Event",
+    "col_log_detail": "Detail",
+
+    # Status strings
+    "status_ok": "OK",
+    "status_drift": "Changed",
+    "status_nobase": "No baseline",
+
+    # Dialogs / common UI
+    "dlg_add_ext_title": "Add Protected Extension",
+    "dlg_add_ext_prompt": "Enter an extension (e.g. .py / .docx / .pdf):",
+    "dlg_invalid_ext": "Invalid extension format. Example: .pdf",
+    "dlg_info_title": "Info",
+    "dlg_confirm_title": "Confirm",
+    "dlg_added_hint": "Added {ext}\n\nNext: manually set the default app for this extension in Windows, then click “Set All to Current (Baseline)” (or select it and click “Set Selected as Baseline”).",
+    "dlg_capture_done": "Captured baseline associations for {n} extension(s).",
+    "dlg_capture_none": "No valid ProgId captured.\n\nPlease set the default app manually first, then capture again.",
+    "dlg_force_restore_done": "Force restore finished: processed {n} extension(s).",
+    "dlg_status_title": "Current Guard Status",
+    "dlg_status_col_ext": "Extension",
+    "dlg_status_col_base": "Saved Baseline (ProgId)",
+    "dlg_status_col_curr": "Current (ProgId)",
+    "dlg_refresh": "Refresh",
+    "dlg_close": "Close",
+
+    # Panel messages
+    "msg_no_selection": "Please select at least one row.",
+    "msg_import_none": "No extensions with a per-user default (UserChoice) were found.\n\nYou can add extensions manually and then click “Set All to Current (Baseline)”.",
+    "msg_import_none_valid": "Found {found} extension(s), but none had a valid ProgId (apps may have been uninstalled).",
+    "msg_import_confirm": "Detected {n} extension(s) with per-user defaults (UserChoice).\n\nImport them and capture as baseline now?\n(Recommended to guard 5–20; you can remove extras later.)",
+    "msg_import_done": "Import finished: found {found}, imported {imported} (newly added {added}), skipped {skipped} invalid.",
+    "msg_select_one": "Please select exactly one row.",
+    "msg_deleted": "Removed {n} item(s).",
+    "msg_capture_sel_done": "Captured baseline for selected: {n} item(s).",
+    "msg_capture_sel_none": "No valid ProgId captured for the selection.\n\nPlease set the default app in Windows first.",
+    "msg_restore_sel_done": "Restore finished: processed {n}, succeeded {ok}.",
+    "msg_confirm_delete": "Remove the selected {n} item(s)?\n\n{exts}",
+    "msg_confirm_delete_all": "Remove all {n} items?\n\nThis will clear the guard list and all saved baselines.",
+    "msg_delete_all_empty": "There are no protected extensions.",
+    "msg_deleted_all": "Removed all {n} item(s).",
+    "msg_log_count": "{n} row(s)",
+    "msg_invalid_interval": "Monitor interval must be a number between 1 and 60 seconds.",
+    "msg_settings_saved": "Settings saved (monitor interval {sec} seconds).",
+    "msg_settings_hint": "Changes apply immediately.",
+    "msg_settings_changed_detail": "interval={sec}s, notify={notify}, guard={auto}, startup={start}",
+    "msg_startup_toggle_failed": "Failed to update startup setting: {msg}",
+    "msg_log_restore_detail": "restore {prev} -> {base}",
+
+    "msg_import_common_none": "Please select at least one extension.",
+    "msg_import_common_done": "Import finished: selected {selected}, newly added {added}, captured {captured} baseline(s), skipped {invalid} invalid.",
+    "msg_edit_baseline_prompt": "Enter a new baseline ProgId for {ext} (leave empty to clear):",
+    "msg_invalid_progid": "Invalid or missing ProgId: {progid}",
+    "msg_baseline_cleared": "Baseline cleared for {ext}.",
+    "msg_baseline_set": "Baseline updated for {ext}.",
+    "msg_hidden_to_tray": "Hidden to tray. Guarding continues in the background.",
+    "msg_open_baseline_no_base": "{ext} has no baseline yet.",
+    "msg_open_baseline_no_target": "Cannot resolve executable for this baseline: {progid}",
+    "msg_open_baseline_failed": "Failed to open: {target}\n{msg}",
+    "msg_pick_app_required": "Please choose an app from the list first.",
+    "msg_manual_progid_required": "Enter a ProgId first, or disable manual mode and choose an app.",
+
+    # Import common dialog
+    "dlg_import_common_title": "Import Common Extensions",
+    "dlg_import_common_desc": "Select common extensions to guard. You can import first and remove extras later.",
+    "dlg_import_common_manual": "Manual input",
+    "dlg_import_common_manual_hint": "Enter extensions (e.g. .mov .mkv), separated by commas, semicolons, or spaces.",
+    "dlg_import_common_presets": "Quick presets",
+    "dlg_import_common_list": "Common extension list",
+    "preset_docs": "Documents",
+    "preset_images": "Images",
+    "preset_code": "Code",
+    "preset_archives": "Archives",
+    "preset_audio": "Audio",
+    "preset_video": "Video",
+    "btn_select_all": "Select All",
+    "btn_select_none": "Select None",
+    "chk_capture_after_import": "Capture current associations as baseline after import",
+    "btn_import": "Import",
+    "btn_confirm_import": "Confirm Import",
+    "btn_cancel": "Cancel",
+
+    # Notifications
+    "ntf_title": "WinAssocGuard",
+    "ntf_auto_restore_ok": "Auto-restore succeeded: {exts}",
+    "ntf_auto_restore_fail": "Auto-restore failed: {exts}",
+    "ntf_capture_ok": "Capture succeeded: {n} item(s)",
+    "ntf_import_done": "Imported & captured: {n}",
+    "ntf_import_common_done": "Imported common extensions: {n}",
+    "ntf_force_restore_ok": "Force restore done: {n} item(s)",
+    "ntf_added": "Protected extension added: {ext}",
+    "ntf_hidden": "Hidden to tray (still guarding in background).",
+    "ntf_error": "Error: {msg}",
+
+    "lbl_log_filter": "Filter by ext:",
+    "lbl_log_limit": "Recent:",
+    "grp_settings_guard": "Guard Settings",
+    "lbl_settings_interval": "Monitor interval",
+    "lbl_settings_seconds": "sec",
+    "chk_settings_notifications": "Enable system notifications",
+    "chk_settings_guard_enabled": "Enable guard (auto restore)",
+    "chk_settings_auto_start": "Launch at startup",
+    "btn_apply_settings": "Apply Settings",
+
+    "btn_confirm": "Confirm",
+    "btn_clear_baseline": "Clear Baseline",
+    "dlg_edit_baseline_title": "Edit Baseline: {ext}",
+    "dlg_edit_baseline_desc": "Select an app for {ext} as baseline.",
+    "dlg_edit_baseline_candidates": "Available apps",
+    "dlg_edit_baseline_candidates_empty": "No app candidates. Enable manual mode to enter ProgId.",
+    "dlg_edit_baseline_manual": "Manual ProgId (Advanced)",
+    "chk_show_manual_progid": "Enter ProgId manually (Advanced)",
+
+    "log_event_ext_added": "Added protected extension",
+    "log_event_ext_deleted": "Removed protected extension",
+    "log_event_deleted_all": "Removed all protected extensions",
+    "log_event_imported_ext": "Imported extension",
+    "log_event_capture_selected": "Captured selected baseline",
+    "log_event_capture_all": "Captured all baselines",
+    "log_event_import_defaults": "Imported current defaults",
+    "log_event_restore_ok": "Manual restore succeeded",
+    "log_event_restore_failed": "Manual restore failed",
+    "log_event_baseline_set": "Baseline updated",
+    "log_event_baseline_cleared": "Baseline cleared",
+    "log_event_auto_restore_ok": "Auto restore succeeded",
+    "log_event_auto_restore_failed": "Auto restore failed",
+    "log_event_settings_updated": "Settings updated",
+
+    # Errors / Warnings
+    "warn_windows_only": "This app is Windows-only.",
+}
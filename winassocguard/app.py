@@ -4,38 +4,49 @@ Core application orchestration.
 
 - Loads/saves config.json
 - Runs a tray icon (pystray)
-- Runs a monitoring thread (every 3s)
+- Runs a monitoring thread (woken by registry change notifications, with a periodic fallback)
 - Provides a single-window "Control Panel" (tkinter)
 - Uses plyer for notifications
 """
 
 from __future__ import annotations
 
-import queue
 import sys
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 
 import tkinter as tk
 import winreg
 
+try:
+    # Optional: much cheaper uncontended acquire than threading.RLock.
+    from fastrlock.rlock import FastRLock as _RLock  # type: ignore
+except ImportError:
+    from threading import RLock as _RLock
+
 from .config import AppConfig, ConfigManager
 from .i18n import LANG_EN, LANG_ZH, t as i18n_t
 from .icon import make_lock_icon
-from .notify import notify
+from .notify import notify_key
 from .registry import (
+    AssocChangeWatcher,
+    batch_get_effective_progids,
+    enumerate_userchoice_progids,
     get_effective_progid,
+    invalidate_applications_index,
     is_progid_valid,
     list_candidate_progids_for_ext,
     format_progid_for_picker,
     format_progid_for_display,
-    is_valid_ext,
+    normalize_and_validate,
     normalize_ext,
-    restore_to_baseline,
-    list_user_fileexts,
+    restore_many,
+    subscribe_registry_changes,
 )
 from .tray import TrayActions, TrayController
 from .ui import (
@@ -87,11 +98,39 @@ class AppState:
     notifications_enabled: bool = True
     auto_restore_enabled: bool = True
     auto_start_enabled: bool = False
-    lock: threading.RLock = field(default_factory=threading.RLock)
+    lock: "threading.RLock" = field(default_factory=_RLock)
+    # Bumped (under lock) by every mutation; lets the writer skip unchanged saves.
+    version: int = 0
+    _baseline_snapshot: Mapping[str, str] = field(
+        default_factory=lambda: MappingProxyType({}), init=False, repr=False, compare=False
+    )
+    _baseline_snapshot_version: int = field(default=-1, init=False, repr=False, compare=False)
+    _sorted_exts_cache: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _sorted_exts_version: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def sorted_exts(self) -> Tuple[str, ...]:
+        """
+        Sorted `protected_exts`, re-sorted only after a mutation.
+        """
+        with self.lock:
+            if self._sorted_exts_version != self.version:
+                self._sorted_exts_cache = tuple(sorted(self.protected_exts))
+                self._sorted_exts_version = self.version
+            return self._sorted_exts_cache
+
+    def snapshot_baselines(self) -> Mapping[str, str]:
+        """
+        Read-only copy of `baseline_progid`, rebuilt only after a mutation.
+        """
+        with self.lock:
+            if self._baseline_snapshot_version != self.version:
+                self._baseline_snapshot = MappingProxyType(dict(self.baseline_progid))
+                self._baseline_snapshot_version = self.version
+            return self._baseline_snapshot
 
     def to_config(self) -> AppConfig:
         with self.lock:
-            protected = sorted(self.protected_exts)
+            protected = list(self.sorted_exts())
             base = {k: v for k, v in self.baseline_progid.items() if k in self.protected_exts and v}
             return AppConfig(
                 language=self.language,
@@ -108,8 +147,8 @@ class AppState:
         language = _clamp_lang(cfg.language)
         protected: Set[str] = set()
         for ext in cfg.protected_exts or []:
-            extn = normalize_ext(ext)
-            if is_valid_ext(extn):
+            extn = normalize_and_validate(ext)
+            if extn:
                 protected.add(extn)
         baseline: Dict[str, str] = {}
         for k, v in (cfg.last_known_progid or {}).items():
@@ -133,33 +172,49 @@ class EventLog:
     ext: str
     event_key: str
     detail: str = ""
+    _ts_text: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def ts_text(self) -> str:
+        # `ts` never changes, so format once and reuse across log refreshes.
+        if self._ts_text is None:
+            self._ts_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.ts))
+        return self._ts_text
 
 
 class WinAssocGuardApp:
     STARTUP_RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
     STARTUP_VALUE_NAME = "WinAssocGuard"
+    # Worker threads only append to gui_queue; the Tk thread drains it on this poll.
+    GUI_POLL_MS = 50
+    GUI_POLL_HIDDEN_MS = 200  # while withdrawn to tray: fewer wake-ups, tray clicks still feel instant
 
     def __init__(self, base_dir: Path):
         self.base_dir = base_dir
         self.config_path = base_dir / "config.json"
         self.cfg_mgr = ConfigManager(self.config_path)
-        self.state = AppState.from_config(self.cfg_mgr.load())
+        self.state = AppState.from_config(self.cfg_mgr.config)
         # Use real system startup state so UI reflects current machine setting.
         self.state.auto_start_enabled = self._read_startup_enabled()
 
         self.root: Optional[tk.Tk] = None
         self.panel: Optional[ControlPanel] = None
-        self.gui_queue: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        # deque.append/popleft are atomic in CPython, so no Queue locking is needed.
+        self.gui_queue: "deque[Callable[[], None]]" = deque()
 
         self.stop_event = threading.Event()
         self.monitor_thread: Optional[threading.Thread] = None
+        self.config_writer_thread: Optional[threading.Thread] = None
+        self._config_dirty = threading.Event()
+        self._config_write_lock = threading.Lock()
+        self._saved_version = -1  # forces the first flush to write
+        self._assoc_watcher: Optional[AssocChangeWatcher] = None
 
         self.tray: Optional[TrayController] = None
 
-        # For auto-restore spam control
+        # For auto-restore spam control (time.monotonic() stamps)
         self._last_restore_ts: Dict[str, float] = {}
-        self._event_logs: List[EventLog] = []
         self._max_log_entries: int = 1200
+        self._event_logs: "deque[EventLog]" = deque(maxlen=self._max_log_entries)
 
     def _build_startup_command(self) -> str:
         if getattr(sys, "frozen", False):
@@ -205,48 +260,76 @@ class WinAssocGuardApp:
         with self.state.lock:
             if not self.state.notifications_enabled:
                 return
-        title = self.tr("ntf_title")
-        msg = self.tr(msg_key, **kwargs)
-        notify(title=title, message=msg, timeout=5, app_name=title)
+            lang = self.state.language
+        notify_key(lang, "ntf_title", msg_key, timeout=5, **kwargs)
 
     def _append_log(self, event_key: str, ext: str = "", detail: str = "") -> None:
         extn = normalize_ext(ext) if ext else ""
         with self.state.lock:
             self._event_logs.append(EventLog(ts=time.time(), ext=extn, event_key=event_key, detail=detail))
-            overflow = len(self._event_logs) - self._max_log_entries
-            if overflow > 0:
-                del self._event_logs[:overflow]
 
     # --------- queue / tkinter thread bridge ---------
     def enqueue_ui(self, func: Callable[[], None]) -> None:
-        self.gui_queue.put(func)
+        # Never touch Tk here: this runs on monitor / tray / worker threads.
+        self.gui_queue.append(func)
 
     def _process_gui_queue(self) -> None:
         if self.root is None:
             return
-        try:
-            while True:
-                task = self.gui_queue.get_nowait()
+        while True:
+            try:
+                task = self.gui_queue.popleft()
+            except IndexError:
+                break
+            try:
+                task()
+            except Exception as e:
                 try:
-                    task()
-                except Exception as e:
-                    try:
-                        show_error(self.root, self.tr("dlg_info_title"), self.tr("ntf_error", msg=str(e)))
-                    except Exception:
-                        pass
-        except queue.Empty:
+                    show_error(self.root, self.tr("dlg_info_title"), self.tr("ntf_error", msg=str(e)))
+                except Exception:
+                    pass
+
+    def _poll_gui_queue(self) -> None:
+        self._process_gui_queue()
+        if self.root is None:
+            return
+        delay = self.GUI_POLL_MS
+        try:
+            if self.root.state() == "withdrawn":
+                delay = self.GUI_POLL_HIDDEN_MS
+        except Exception:
             pass
-        self.root.after(120, self._process_gui_queue)
+        self.root.after(delay, self._poll_gui_queue)
 
     # --------- state helpers ---------
     def _save_config(self) -> None:
-        cfg = self.state.to_config()
-        self.cfg_mgr.save(cfg)
+        # Debounced: the writer thread persists state shortly after the last change.
+        self._config_dirty.set()
+
+    def _flush_config(self, pretty: bool = False) -> None:
+        with self._config_write_lock:
+            self._config_dirty.clear()
+            with self.state.lock:
+                version = self.state.version
+                if version == self._saved_version:
+                    return
+                cfg = self.state.to_config()
+            if self.cfg_mgr.save(cfg, pretty=pretty):
+                self._saved_version = version
+
+    def _config_writer_loop(self) -> None:
+        debounce = 0.5  # seconds; coalesces bursts of actions into one write
+        while not self.stop_event.is_set():
+            if not self._config_dirty.wait(timeout=debounce):
+                continue
+            if self.stop_event.wait(debounce):
+                break
+            self._flush_config()
 
     def get_status_rows(self) -> Sequence[StatusRow]:
         with self.state.lock:
-            exts = sorted(self.state.protected_exts)
-            baseline_map = dict(self.state.baseline_progid)
+            exts = self.state.sorted_exts()
+            baseline_map = self.state.snapshot_baselines()
 
         rows: List[StatusRow] = []
         for ext in exts:
@@ -261,6 +344,10 @@ class WinAssocGuardApp:
             rows.append((ext, format_progid_for_display(base), status))
         return rows
 
+    def count_protected_exts(self) -> int:
+        with self.state.lock:
+            return len(self.state.protected_exts)
+
     def get_baseline_progid(self, ext: str) -> str:
         extn = normalize_ext(ext)
         if not extn:
@@ -268,22 +355,22 @@ class WinAssocGuardApp:
         with self.state.lock:
             return (self.state.baseline_progid.get(extn) or "").strip()
 
-    def get_baseline_candidates(self, ext: str) -> Sequence[Tuple[str, str]]:
+    def get_baseline_candidates(self, ext: str) -> Iterator[Tuple[str, str]]:
         extn = normalize_ext(ext)
         if not extn:
-            return []
+            return iter(())
 
         with self.state.lock:
             baseline = (self.state.baseline_progid.get(extn) or "").strip()
 
+        # The picker is opening: pick up apps installed since the index was built.
+        invalidate_applications_index()
         raw_candidates = list_candidate_progids_for_ext(extn)
         if baseline and baseline not in raw_candidates:
             raw_candidates.insert(0, baseline)
 
-        out: List[Tuple[str, str]] = []
-        for progid in raw_candidates:
-            out.append((progid, format_progid_for_picker(progid)))
-        return out
+        # Display names are resolved lazily, as the picker consumes the rows.
+        return ((progid, format_progid_for_picker(progid)) for progid in raw_candidates)
 
     def get_log_rows(self, ext_filter: str, limit: int) -> Sequence[LogRow]:
         raw = (ext_filter or "").strip()
@@ -293,18 +380,17 @@ class WinAssocGuardApp:
         except Exception:
             max_rows = 200
         max_rows = max(10, min(max_rows, 1000))
+        # Copy only the entries we will show; format outside the lock.
+        picked: List[EventLog] = []
         with self.state.lock:
-            snapshot = list(self._event_logs)
+            for entry in reversed(self._event_logs):
+                if extn and entry.ext != extn:
+                    continue
+                picked.append(entry)
+                if len(picked) >= max_rows:
+                    break
 
-        rows: List[LogRow] = []
-        for entry in reversed(snapshot):
-            if extn and entry.ext != extn:
-                continue
-            ts_local = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry.ts))
-            rows.append((ts_local, entry.ext or "-", self.tr(entry.event_key), entry.detail or ""))
-            if len(rows) >= max_rows:
-                break
-        return rows
+        return [(entry.ts_text(), entry.ext or "-", self.tr(entry.event_key), entry.detail or "") for entry in picked]
 
     def get_settings_snapshot(self) -> SettingsSnapshot:
         startup_enabled = self._read_startup_enabled()
@@ -324,13 +410,16 @@ class WinAssocGuardApp:
             self.state.monitor_interval_sec = interval
             self.state.notifications_enabled = bool(settings.notifications_enabled)
             self.state.auto_restore_enabled = bool(settings.auto_restore_enabled)
+            self.state.version += 1
         try:
             self._write_startup_enabled(bool(settings.auto_start_enabled))
         except Exception as e:
             show_warning(self.root, self.tr("dlg_info_title"), self.tr("msg_startup_toggle_failed", msg=str(e)))
         with self.state.lock:
             self.state.auto_start_enabled = self._read_startup_enabled()
-        self._save_config()
+            self.state.version += 1
+        # Explicit user save: write now, in the readable layout.
+        self._flush_config(pretty=True)
         self._append_log(
             "log_event_settings_updated",
             detail=self.tr(
@@ -346,14 +435,16 @@ class WinAssocGuardApp:
     # --------- actions for control panel ---------
     def action_add_extension_value(self, ext_raw: str) -> None:
         assert self.root is not None
-        extn = normalize_ext(ext_raw)
-        if not is_valid_ext(extn):
+        extn = normalize_and_validate(ext_raw)
+        if not extn:
             show_warning(self.root, self.tr("dlg_info_title"), self.tr("dlg_invalid_ext"))
             return
 
         with self.state.lock:
             already = extn in self.state.protected_exts
             self.state.protected_exts.add(extn)
+            if not already:
+                self.state.version += 1
 
         self._save_config()
         if not already:
@@ -371,6 +462,7 @@ class WinAssocGuardApp:
                     self.state.baseline_progid.pop(extn, None)
                 if extn:
                     deleted.append(extn)
+            self.state.version += 1
         self._save_config()
         for extn in deleted:
             self._append_log("log_event_ext_deleted", ext=extn)
@@ -380,6 +472,7 @@ class WinAssocGuardApp:
             n = len(self.state.protected_exts)
             self.state.protected_exts.clear()
             self.state.baseline_progid.clear()
+            self.state.version += 1
         self._save_config()
         if n > 0:
             self._append_log("log_event_deleted_all", detail=self.tr("msg_deleted_all", n=n))
@@ -396,8 +489,8 @@ class WinAssocGuardApp:
         seen: Set[str] = set()
         cleaned: List[str] = []
         for ext in exts:
-            extn = normalize_ext(ext)
-            if not is_valid_ext(extn):
+            extn = normalize_and_validate(ext)
+            if not extn:
                 invalid += 1
                 continue
             if extn in seen:
@@ -414,6 +507,7 @@ class WinAssocGuardApp:
             for extn in cleaned:
                 self.state.protected_exts.add(extn)
             after_cnt = len(self.state.protected_exts)
+            self.state.version += 1
 
         added = max(0, after_cnt - before_cnt)
         captured = 0
@@ -423,6 +517,7 @@ class WinAssocGuardApp:
                 if progid and is_progid_valid(progid):
                     with self.state.lock:
                         self.state.baseline_progid[extn] = progid
+                        self.state.version += 1
                     captured += 1
 
         self._save_config()
@@ -443,14 +538,15 @@ class WinAssocGuardApp:
 
     def action_capture_selected(self, exts: Sequence[str]) -> None:
         assert self.root is not None
-        captured = 0
-        for ext in exts:
-            extn = normalize_ext(ext)
-            progid = get_effective_progid(extn)
-            if progid and is_progid_valid(progid):
-                with self.state.lock:
-                    self.state.baseline_progid[extn] = progid
-                captured += 1
+        # Registry I/O outside the lock; then commit the whole batch at once.
+        extns = [e for e in (normalize_ext(ext) for ext in exts) if e]
+        currents = batch_get_effective_progids(extns)
+        pairs = [(extn, p) for extn, p in currents.items() if p and is_progid_valid(p)]
+        captured = len(pairs)
+        if pairs:
+            with self.state.lock:
+                self.state.baseline_progid.update(pairs)
+                self.state.version += 1
 
         self._save_config()
         if captured > 0:
@@ -463,16 +559,16 @@ class WinAssocGuardApp:
     def action_capture_all(self) -> None:
         # Capture baselines for all protected exts.
         assert self.root is not None
-        captured = 0
-        with self.state.lock:
-            exts = sorted(self.state.protected_exts)
+        exts = self.state.sorted_exts()
 
-        for ext in exts:
-            progid = get_effective_progid(ext)
-            if progid and is_progid_valid(progid):
-                with self.state.lock:
-                    self.state.baseline_progid[ext] = progid
-                captured += 1
+        # Registry I/O outside the lock; then commit the whole batch at once.
+        currents = batch_get_effective_progids(exts)
+        pairs = [(ext, p) for ext, p in currents.items() if p and is_progid_valid(p)]
+        captured = len(pairs)
+        if pairs:
+            with self.state.lock:
+                self.state.baseline_progid.update(pairs)
+                self.state.version += 1
 
         self._save_config()
         if captured > 0:
@@ -494,17 +590,17 @@ class WinAssocGuardApp:
         """
         assert self.root is not None
 
-        exts = list_user_fileexts(only_userchoice=True)
-        found = len(exts)
+        # Single registry sweep: (ext, current ProgId) for every UserChoice ext
+        found_pairs = enumerate_userchoice_progids()
+        found = len(found_pairs)
         if found == 0:
             show_warning(self.root, self.tr("dlg_info_title"), self.tr("msg_import_none"))
             return
 
-        # Resolve current ProgId and keep only valid ones
+        # Keep only valid ProgIds
         pairs: List[Tuple[str, str]] = []
         skipped = 0
-        for ext in exts:
-            progid = get_effective_progid(ext)
+        for ext, progid in found_pairs:
             if progid and is_progid_valid(progid):
                 pairs.append((ext, progid))
             else:
@@ -529,6 +625,7 @@ class WinAssocGuardApp:
                 self.state.protected_exts.add(ext)
                 self.state.baseline_progid[ext] = progid
             after_cnt = len(self.state.protected_exts)
+            self.state.version += 1
 
         added = max(0, after_cnt - before_cnt)
         captured = len(pairs)
@@ -544,24 +641,24 @@ class WinAssocGuardApp:
 
     def action_restore_selected(self, exts: Sequence[str]) -> None:
         assert self.root is not None
-        processed = 0
         ok_cnt = 0
 
-        with self.state.lock:
-            baseline_map = dict(self.state.baseline_progid)
+        baseline_map = self.state.snapshot_baselines()
 
+        pairs: List[Tuple[str, str]] = []
         for ext in exts:
             extn = normalize_ext(ext)
             baseline = baseline_map.get(extn, "")
-            if not baseline:
-                continue
-            processed += 1
-            res = restore_to_baseline(extn, baseline)
+            if baseline:
+                pairs.append((extn, baseline))
+        processed = len(pairs)
+
+        for res in restore_many(pairs):
             if res.ok:
                 ok_cnt += 1
-                self._append_log("log_event_restore_ok", ext=extn)
+                self._append_log("log_event_restore_ok", ext=res.ext)
             else:
-                self._append_log("log_event_restore_failed", ext=extn, detail=res.error or "")
+                self._append_log("log_event_restore_failed", ext=res.ext, detail=res.error or "")
 
         self._save_config()
         show_info(self.root, self.tr("dlg_info_title"), self.tr("msg_restore_sel_done", n=processed, ok=ok_cnt))
@@ -573,16 +670,14 @@ class WinAssocGuardApp:
         with self.state.lock:
             items = sorted((ext, progid) for ext, progid in self.state.baseline_progid.items() if progid)
 
-        processed = 0
+        processed = len(items)
         ok_cnt = 0
-        for ext, progid in items:
-            processed += 1
-            res = restore_to_baseline(ext, progid)
+        for res in restore_many(items):
             if res.ok:
                 ok_cnt += 1
-                self._append_log("log_event_restore_ok", ext=ext)
+                self._append_log("log_event_restore_ok", ext=res.ext)
             else:
-                self._append_log("log_event_restore_failed", ext=ext, detail=res.error or "")
+                self._append_log("log_event_restore_failed", ext=res.ext, detail=res.error or "")
 
         self._save_config()
         show_info(self.root, self.tr("dlg_info_title"), self.tr("dlg_force_restore_done", n=processed))
@@ -602,6 +697,7 @@ class WinAssocGuardApp:
         if not progid:
             with self.state.lock:
                 self.state.baseline_progid.pop(extn, None)
+                self.state.version += 1
             self._save_config()
             show_info(self.root, self.tr("dlg_info_title"), self.tr("msg_baseline_cleared", ext=extn))
             self._append_log("log_event_baseline_cleared", ext=extn)
@@ -613,6 +709,7 @@ class WinAssocGuardApp:
 
         with self.state.lock:
             self.state.baseline_progid[extn] = progid
+            self.state.version += 1
         self._save_config()
         show_info(self.root, self.tr("dlg_info_title"), self.tr("msg_baseline_set", ext=extn))
         self._append_log("log_event_baseline_set", ext=extn, detail=format_progid_for_display(progid))
@@ -620,6 +717,7 @@ class WinAssocGuardApp:
     def action_switch_language(self) -> None:
         with self.state.lock:
             self.state.language = LANG_EN if self.state.language == LANG_ZH else LANG_ZH
+            self.state.version += 1
         self._save_config()
         # Update tray immediately
         if self.tray is not None:
@@ -660,10 +758,27 @@ class WinAssocGuardApp:
             except Exception:
                 pass
 
+    def _on_registry_changed(self) -> None:
+        # Called on tkinter thread. Hidden panels refresh when shown again.
+        if self.root is None or self.panel is None:
+            return
+        try:
+            if self.root.state() == "withdrawn":
+                return
+            self.panel.refresh()
+        except Exception:
+            pass
+
+    def _stop_monitor(self) -> None:
+        self.stop_event.set()
+        watcher = self._assoc_watcher
+        if watcher is not None:
+            watcher.wake()
+
     def action_exit(self) -> None:
         # Called on tkinter thread.
-        self.stop_event.set()
-        self._save_config()
+        self._stop_monitor()
+        self._flush_config()
         if self.tray is not None:
             self.tray.stop()
         if self.root is not None:
@@ -676,67 +791,75 @@ class WinAssocGuardApp:
     def _monitor_loop(self) -> None:
         cooldown = 12.0  # seconds per extension to avoid toast spam on stubborn systems
 
-        while not self.stop_event.is_set():
-            to_restore: List[Tuple[str, str, str]] = []
-
-            with self.state.lock:
-                baselines = dict(self.state.baseline_progid)
-                interval = _clamp_interval_seconds(self.state.monitor_interval_sec)
-                auto_restore_enabled = bool(self.state.auto_restore_enabled)
-
-            if not auto_restore_enabled:
-                for _ in range(int(interval * 10)):
-                    if self.stop_event.is_set():
-                        break
-                    time.sleep(0.1)
-                continue
-
-            now_ts = time.time()
-            for ext, baseline in baselines.items():
-                if not baseline:
-                    continue
+        # Created on this thread: registry notifications are bound to the registering thread.
+        watcher = AssocChangeWatcher(self.stop_event)
+        self._assoc_watcher = watcher
+        try:
+            while not self.stop_event.is_set():
+                with self.state.lock:
+                    baselines = self.state.snapshot_baselines()
+                    interval = _clamp_interval_seconds(self.state.monitor_interval_sec)
+                    auto_restore_enabled = bool(self.state.auto_restore_enabled)
 
-                last = self._last_restore_ts.get(ext, 0.0)
-                if now_ts - last < cooldown:
+                if not auto_restore_enabled:
+                    watcher.wait(interval)
                     continue
 
-                current = get_effective_progid(ext)
-                if current != baseline:
-                    to_restore.append((ext, baseline, current or ""))
-
-            ok_exts: List[str] = []
-            fail_exts: List[str] = []
-
-            for ext, baseline, prev in to_restore:
-                self._last_restore_ts[ext] = time.time()
-                res = restore_to_baseline(ext, baseline)
-                if res.ok:
-                    ok_exts.append(ext)
-                    self._append_log(
-                        "log_event_auto_restore_ok",
-                        ext=ext,
-                        detail=self.tr("msg_log_restore_detail", prev=prev or "-", base=baseline),
-                    )
-                else:
-                    fail_exts.append(ext)
-                    self._append_log("log_event_auto_restore_failed", ext=ext, detail=res.error or "")
-
-            if ok_exts:
-                self.notify_i18n("ntf_auto_restore_ok", exts=_format_exts_for_message(ok_exts))
-            if fail_exts:
-                self.notify_i18n("ntf_auto_restore_fail", exts=_format_exts_for_message(fail_exts))
-
-            for _ in range(int(interval * 10)):
-                if self.stop_event.is_set():
-                    break
-                time.sleep(0.1)
+                # Monotonic: wall-clock jumps must not stall or spam auto-restore.
+                now_ts = time.monotonic()
+                last_restore = self._last_restore_ts
+                never = float("-inf")
+                due = [
+                    ext
+                    for ext, baseline in baselines.items()
+                    if baseline and now_ts - last_restore.get(ext, never) >= cooldown
+                ]
+                currents = batch_get_effective_progids(due)
+                to_restore: List[Tuple[str, str, str]] = [
+                    (ext, baselines[ext], current or "")
+                    for ext, current in currents.items()
+                    if current != baselines[ext]
+                ]
+
+                ok_exts: List[str] = []
+                fail_exts: List[str] = []
+
+                for ext, _baseline, _prev in to_restore:
+                    last_restore[ext] = now_ts
+                results = restore_many(
+                    [(ext, baseline) for ext, baseline, _prev in to_restore],
+                    previous=currents,
+                )
+
+                for (ext, baseline, prev), res in zip(to_restore, results):
+                    if res.ok:
+                        ok_exts.append(ext)
+                        self._append_log(
+                            "log_event_auto_restore_ok",
+                            ext=ext,
+                            detail=self.tr("msg_log_restore_detail", prev=prev or "-", base=baseline),
+                        )
+                    else:
+                        fail_exts.append(ext)
+                        self._append_log("log_event_auto_restore_failed", ext=ext, detail=res.error or "")
+
+                if ok_exts:
+                    self.notify_i18n("ntf_auto_restore_ok", exts=_format_exts_for_message(ok_exts))
+                if fail_exts:
+                    self.notify_i18n("ntf_auto_restore_fail", exts=_format_exts_for_message(fail_exts))
+
+                # Sleep until the registry changes (or the interval elapses as a fallback).
+                watcher.wait(interval)
+        finally:
+            self._assoc_watcher = None
+            watcher.close()
 
     # --------- lifecycle ---------
     def run(self) -> None:
         # Create Tk root on main thread (visible control panel)
         self.root = tk.Tk()
         self.root.title(self.tr("panel_title"))
-        self.root.after(120, self._process_gui_queue)
+        self.root.after(self.GUI_POLL_MS, self._poll_gui_queue)
 
         # Close button hides to tray (common tray-app behavior)
         self.root.protocol("WM_DELETE_WINDOW", self.action_hide_to_tray)
@@ -745,6 +868,7 @@ class WinAssocGuardApp:
         callbacks = ControlPanelCallbacks(
             tr=lambda key, **kwargs: self.tr(key, **kwargs),
             get_rows=self.get_status_rows,
+            count_rows=self.count_protected_exts,
             add_ext=self.action_add_extension_value,
             delete_exts=self.action_delete_extensions,
             import_common=self.action_import_common,
@@ -760,6 +884,7 @@ class WinAssocGuardApp:
             exit_app=self.action_exit,
         )
         self.panel = ControlPanel(self.root, cb=callbacks)
+        unsubscribe = subscribe_registry_changes(lambda: self.enqueue_ui(self._on_registry_changed))
 
         # Tray
         image = make_lock_icon(64)
@@ -780,6 +905,11 @@ class WinAssocGuardApp:
         self.monitor_thread = threading.Thread(target=self._monitor_loop, name="WinAssocGuardMonitor", daemon=True)
         self.monitor_thread.start()
 
+        self.config_writer_thread = threading.Thread(
+            target=self._config_writer_loop, name="WinAssocGuardConfigWriter", daemon=True
+        )
+        self.config_writer_thread.start()
+
         # Start tray
         self.tray.run_detached()
 
@@ -787,10 +917,13 @@ class WinAssocGuardApp:
         self.root.mainloop()
 
         # Cleanup (best effort)
-        self.stop_event.set()
+        unsubscribe()
+        self._stop_monitor()
         try:
             if self.monitor_thread and self.monitor_thread.is_alive():
                 self.monitor_thread.join(timeout=1.5)
+            if self.config_writer_thread and self.config_writer_thread.is_alive():
+                self.config_writer_thread.join(timeout=1.0)
         except Exception:
             pass
-        self._save_config()
+        self._flush_config()
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 """
-Config persistence in a human-readable JSON file.
+Config persistence in a JSON file.
+
+Background saves write compact JSON; saves from the settings panel are
+pretty-printed so the file stays readable for hand edits.
 
 Spec fields:
 - protected_exts: list[str]
@@ -14,14 +17,61 @@ Spec fields:
 
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import dataclass, field
+import operator
+import os
+import sys
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+try:
+    # Optional: faster, emits UTF-8 bytes directly.
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
+try:
+    # Optional: compiles the schema below into a straight-line validator.
+    import fastjsonschema  # type: ignore
+except ImportError:
+    fastjsonschema = None
 
 DEFAULT_CONFIG_FILENAME = "config.json"
 
+# Shape of a well-formed config.json. Data matching it skips the lenient
+# per-field coercion in `AppConfig.from_dict`.
+CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "language": {"type": "string", "enum": ["zh", "en"], "default": "zh"},
+        "protected_exts": {"type": "array", "items": {"type": "string"}, "default": []},
+        "last_known_progid": {
+            "type": "object",
+            "additionalProperties": {"type": "string"},
+            "default": {},
+        },
+        "monitor_interval_sec": {"type": "number", "minimum": 1.0, "maximum": 60.0, "default": 3.0},
+        "notifications_enabled": {"type": "boolean", "default": True},
+        "auto_restore_enabled": {"type": "boolean", "default": True},
+        "auto_start_enabled": {"type": "boolean", "default": False},
+    },
+}
+
+_validate_config = None
+if fastjsonschema is not None:
+    try:
+        _validate_config = fastjsonschema.compile(CONFIG_SCHEMA)
+    except Exception:
+        _validate_config = None
+
+
+_BOOL_MAP: Dict[str, bool] = {
+    **{s: True for s in ("1", "true", "yes", "on")},
+    **{s: False for s in ("0", "false", "no", "off")},
+}
+
 
 def _to_bool(value, default: bool) -> bool:
     if isinstance(value, bool):
@@ -29,15 +79,15 @@ def _to_bool(value, default: bool) -> bool:
     if isinstance(value, (int, float)):
         return bool(value)
     if isinstance(value, str):
-        s = value.strip().lower()
-        if s in ("1", "true", "yes", "on"):
-            return True
-        if s in ("0", "false", "no", "off"):
-            return False
+        return _BOOL_MAP.get(value.strip().lower(), default)
     return default
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; on 3.9 instances keep a __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class AppConfig:
     language: str = "zh"
     protected_exts: List[str] = field(default_factory=list)
@@ -49,6 +99,23 @@ class AppConfig:
 
     @classmethod
     def from_dict(cls, data: dict) -> "AppConfig":
+        if _validate_config is not None:
+            try:
+                valid = _validate_config(dict(data))
+            except Exception:
+                valid = None  # Not well-formed: coerce field by field below.
+            if valid is not None:
+                return cls(
+                    language=valid["language"],
+                    # Freshly parsed and already all-str; no need to copy.
+                    protected_exts=valid["protected_exts"],
+                    last_known_progid=valid["last_known_progid"],
+                    monitor_interval_sec=float(valid["monitor_interval_sec"]),
+                    notifications_enabled=valid["notifications_enabled"],
+                    auto_restore_enabled=valid["auto_restore_enabled"],
+                    auto_start_enabled=valid["auto_start_enabled"],
+                )
+
         language = data.get("language", "zh")
         protected_exts = data.get("protected_exts", []) or []
         last_known_progid = data.get("last_known_progid", {}) or {}
@@ -69,13 +136,18 @@ class AppConfig:
             monitor_interval_sec = 1.0
         if monitor_interval_sec > 60.0:
             monitor_interval_sec = 60.0
+        # Usually already all-str (JSON output); only rebuild when something isn't.
+        if not all(type(x) is str for x in protected_exts):
+            protected_exts = [str(x) for x in protected_exts]
+        if not all(type(k) is str and type(v) is str for k, v in last_known_progid.items()):
+            last_known_progid = {str(k): str(v) for k, v in last_known_progid.items()}
         notifications_enabled = _to_bool(notifications_enabled, True)
         auto_restore_enabled = _to_bool(auto_restore_enabled, True)
         auto_start_enabled = _to_bool(auto_start_enabled, False)
         return cls(
             language=str(language),
-            protected_exts=[str(x) for x in protected_exts],
-            last_known_progid={str(k): str(v) for k, v in last_known_progid.items()},
+            protected_exts=protected_exts,
+            last_known_progid=last_known_progid,
             monitor_interval_sec=monitor_interval_sec,
             notifications_enabled=notifications_enabled,
             auto_restore_enabled=auto_restore_enabled,
@@ -83,26 +155,55 @@ class AppConfig:
         )
 
     def to_dict(self) -> dict:
-        return {
-            "language": self.language,
-            "protected_exts": self.protected_exts,
-            "last_known_progid": self.last_known_progid,
-            "monitor_interval_sec": self.monitor_interval_sec,
-            "notifications_enabled": self.notifications_enabled,
-            "auto_restore_enabled": self.auto_restore_enabled,
-            "auto_start_enabled": self.auto_start_enabled,
-        }
+        return dict(zip(_FIELDS, _GETTER(self)))
+
+
+# Field order matches the dataclass (and thus the key order in config.json).
+_FIELDS = tuple(f.name for f in fields(AppConfig))
+_GETTER = operator.attrgetter(*_FIELDS)
+
+
+def _digest(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=16).digest()
 
 
 class ConfigManager:
     def __init__(self, config_path: Path):
         self.config_path = config_path
+        self._config: Optional[AppConfig] = None
+        self._config_mtime: Optional[int] = None
+        self._last_digest: Optional[bytes] = None  # digest of bytes last read/written
+
+    def _stat_mtime(self) -> Optional[int]:
+        try:
+            return self.config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @property
+    def config(self) -> AppConfig:
+        """
+        Parsed config, loaded on first access and reloaded if the file changed on disk.
+        """
+        mtime = self._stat_mtime()
+        if self._config is None or mtime != self._config_mtime:
+            self._config = self.load()
+            self._config_mtime = mtime
+        return self._config
+
+    def invalidate(self) -> None:
+        self._config = None
 
     def load(self) -> AppConfig:
         if not self.config_path.exists():
             return AppConfig()
         try:
-            data = json.loads(self.config_path.read_text(encoding="utf-8"))
+            raw = self.config_path.read_bytes()
+            self._last_digest = _digest(raw)
+            if orjson is not None:
+                data = orjson.loads(raw)
+            else:
+                data = json.loads(raw.decode("utf-8"))
             if not isinstance(data, dict):
                 return AppConfig()
             return AppConfig.from_dict(data)
@@ -110,10 +211,32 @@ class ConfigManager:
             # If config is corrupted, start fresh but do not crash.
             return AppConfig()
 
-    def save(self, config: AppConfig) -> None:
+    def save(self, config: AppConfig, *, pretty: bool = False) -> bool:
+        """Persist *config*; returns False if the write failed."""
+        tmp_path = self.config_path.with_suffix(self.config_path.suffix + ".tmp")
         try:
-            payload = json.dumps(config.to_dict(), ensure_ascii=False, indent=2)
-            self.config_path.write_text(payload, encoding="utf-8")
+            data = config.to_dict()
+            if orjson is not None:
+                option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+                payload = orjson.dumps(data, option=option)
+            elif pretty:
+                payload = (json.dumps(data, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+            else:
+                payload = (json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+            digest = _digest(payload)
+            if digest == self._last_digest and self._stat_mtime() == self._config_mtime:
+                return True  # identical to what's on disk; file untouched since
+            # Write-then-rename so a crash mid-write never leaves a truncated config.
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self.config_path)
+            self._config = config
+            self._config_mtime = self._stat_mtime()
+            self._last_digest = digest
+            return True
         except Exception:
             # Don't crash on disk issues; user can still use the app.
-            pass
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return False
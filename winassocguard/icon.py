@@ -7,53 +7,119 @@ No external asset files needed.
 
 from __future__ import annotations
 
+import functools
+import io
+
 from PIL import Image, ImageDraw
 
 
-def make_lock_icon(size: int = 64) -> Image.Image:
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    d = ImageDraw.Draw(img)
+# Colors
+_BLUE = (40, 110, 255, 255)
+_BLUE_DARK = (25, 70, 190, 255)
+_WHITE = (255, 255, 255, 255)
+_CLEAR = (0, 0, 0, 0)
 
-    # Colors
-    blue = (40, 110, 255, 255)
-    blue_dark = (25, 70, 190, 255)
-    white = (255, 255, 255, 255)
 
-    # Body
+def _geometry(size: int) -> dict:
     body_w = int(size * 0.62)
     body_h = int(size * 0.46)
     body_x0 = (size - body_w) // 2
     body_y0 = int(size * 0.42)
-    body_x1 = body_x0 + body_w
-    body_y1 = body_y0 + body_h
-    radius = int(size * 0.08)
 
-    d.rounded_rectangle([body_x0, body_y0, body_x1, body_y1], radius=radius, fill=blue, outline=blue_dark, width=2)
-
-    # Shackle (arc)
     sh_w = int(size * 0.50)
     sh_h = int(size * 0.52)
     sh_x0 = (size - sh_w) // 2
     sh_y0 = int(size * 0.10)
-    sh_x1 = sh_x0 + sh_w
-    sh_y1 = sh_y0 + sh_h
-
-    # Outer arc
-    d.arc([sh_x0, sh_y0, sh_x1, sh_y1], start=200, end=-20, fill=blue, width=int(size * 0.08))
 
-    # Cutout / inner arc (fake thickness by drawing a smaller arc in transparent)
-    inner_pad = int(size * 0.08)
-    d.arc([sh_x0 + inner_pad, sh_y0 + inner_pad, sh_x1 - inner_pad, sh_y1 - inner_pad],
-          start=200, end=-20, fill=(0, 0, 0, 0), width=int(size * 0.08))
-
-    # Keyhole
     kh_cx = size // 2
     kh_cy = int(size * 0.64)
-    kh_r = int(size * 0.06)
-    d.ellipse([kh_cx - kh_r, kh_cy - kh_r, kh_cx + kh_r, kh_cy + kh_r], fill=white)
     stem_w = int(size * 0.06)
-    stem_h = int(size * 0.10)
-    d.rounded_rectangle([kh_cx - stem_w // 2, kh_cy, kh_cx + stem_w // 2, kh_cy + stem_h],
-                        radius=stem_w // 2, fill=white)
+    return {
+        "body": (body_x0, body_y0, body_x0 + body_w, body_y0 + body_h),
+        "body_radius": int(size * 0.08),
+        "shackle": (sh_x0, sh_y0, sh_x0 + sh_w, sh_y0 + sh_h),
+        "shackle_width": int(size * 0.08),
+        "inner_pad": int(size * 0.08),
+        "kh_center": (kh_cx, kh_cy),
+        "kh_r": int(size * 0.06),
+        "stem": (kh_cx - stem_w // 2, kh_cy, kh_cx + stem_w // 2, kh_cy + int(size * 0.10)),
+        "stem_radius": stem_w // 2,
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _build_body(size: int) -> Image.Image:
+    g = _geometry(size)
+    layer = Image.new("RGBA", (size, size), _CLEAR)
+    ImageDraw.Draw(layer).rounded_rectangle(
+        list(g["body"]), radius=g["body_radius"], fill=_BLUE, outline=_BLUE_DARK, width=2
+    )
+    return layer
+
+
+@functools.lru_cache(maxsize=8)
+def _build_shackle(size: int) -> Image.Image:
+    g = _geometry(size)
+    layer = Image.new("RGBA", (size, size), _CLEAR)
+    d = ImageDraw.Draw(layer)
+    sh_x0, sh_y0, sh_x1, sh_y1 = g["shackle"]
+    d.arc([sh_x0, sh_y0, sh_x1, sh_y1], start=200, end=-20, fill=_BLUE, width=g["shackle_width"])
+    # Cutout / inner arc (fake thickness by drawing a smaller arc in transparent)
+    pad = g["inner_pad"]
+    d.arc([sh_x0 + pad, sh_y0 + pad, sh_x1 - pad, sh_y1 - pad],
+          start=200, end=-20, fill=_CLEAR, width=g["shackle_width"])
+    return layer
+
+
+@functools.lru_cache(maxsize=8)
+def _build_keyhole(size: int) -> Image.Image:
+    g = _geometry(size)
+    layer = Image.new("RGBA", (size, size), _CLEAR)
+    d = ImageDraw.Draw(layer)
+    kh_cx, kh_cy = g["kh_center"]
+    kh_r = g["kh_r"]
+    d.ellipse([kh_cx - kh_r, kh_cy - kh_r, kh_cx + kh_r, kh_cy + kh_r], fill=_WHITE)
+    d.rounded_rectangle(list(g["stem"]), radius=g["stem_radius"], fill=_WHITE)
+    return layer
+
+
+def _make_lock_icon_draw(size: int) -> Image.Image:
+    # The shackle cutout lies above the body, so stacking the layers matches drawing in place.
+    img = Image.new("RGBA", (size, size), _CLEAR)
+    img = Image.alpha_composite(img, _build_shackle(size))
+    img = Image.alpha_composite(img, _build_body(size))
+    return Image.alpha_composite(img, _build_keyhole(size))
+
+
+@functools.lru_cache(maxsize=8)
+def _render_lock_icon(size: int) -> Image.Image:
+    return _make_lock_icon_draw(size)
+
+
+def make_lock_icon(size: int = 64) -> Image.Image:
+    # The icon is deterministic per size; hand out copies so callers may mutate.
+    return _render_lock_icon(int(size)).copy()
+
+
+@functools.lru_cache(maxsize=8)
+def make_lock_icon_png(size: int = 64) -> bytes:
+    """
+    PNG-encoded icon, encoded once per size (e.g. for Tk `PhotoImage(data=...)`).
+    """
+    buf = io.BytesIO()
+    _render_lock_icon(int(size)).save(buf, format="PNG", optimize=False, compress_level=1)
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=8)
+def make_lock_icon_ico(size: int = 64) -> bytes:
+    """
+    ICO-encoded icon (for Windows APIs that want an .ico blob), encoded once per size.
+    """
+    buf = io.BytesIO()
+    _render_lock_icon(int(size)).save(buf, format="ICO", sizes=[(int(size), int(size))])
+    return buf.getvalue()
+
 
-    return img
+# The tray uses the default size; render it once up front.
+_DEFAULT_ICON = _render_lock_icon(64)
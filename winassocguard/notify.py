@@ -4,18 +4,45 @@ Notification wrapper.
 
 We use plyer to show native-ish Windows notifications.
 If plyer fails (rare on some setups), we silently fall back to no-op.
+
+Notifications are handed to a single daemon worker so callers (monitor loop,
+Tk thread) never block on plyer. Messages arriving within a short window are
+merged into one toast per title, so restore storms don't flood the OS queue.
 """
 
 from __future__ import annotations
 
-from typing import Optional
+import functools
+import queue
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
 
+from .i18n import t
 
-def notify(title: str, message: str, timeout: int = 5, app_name: Optional[str] = None) -> None:
-    try:
-        from plyer import notification  # type: ignore
+# Resolve the backend once at import instead of on every notification.
+_notify_fn: Optional[Callable[..., None]]
+try:
+    from plyer import notification as _notification  # type: ignore
+
+    _notify_fn = _notification.notify
+except Exception:
+    _notify_fn = None
+
+_COALESCE_SEC = 0.5
+_MAX_LINES = 5
+
+# (title, message, timeout, app_name); bounded so storms drop instead of piling up.
+_queue: "queue.Queue[Tuple[str, str, int, Optional[str]]]" = queue.Queue(maxsize=64)
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
 
-        notification.notify(
+
+def _emit(title: str, message: str, timeout: int, app_name: Optional[str]) -> None:
+    if _notify_fn is None:
+        return
+    try:
+        _notify_fn(
             title=title,
             message=message,
             app_name=app_name or title,
@@ -24,3 +51,82 @@ def notify(title: str, message: str, timeout: int = 5, app_name: Optional[str] =
     except Exception:
         # Best effort: no crash.
         pass
+
+
+def _merge(batch: List[Tuple[str, str, int, Optional[str]]]) -> List[Tuple[str, str, int, Optional[str]]]:
+    # Group by title (first-seen order), dropping duplicate messages.
+    groups: dict[str, List[Tuple[str, str, int, Optional[str]]]] = {}
+    for item in batch:
+        items = groups.setdefault(item[0], [])
+        if all(item[1] != other[1] for other in items):
+            items.append(item)
+
+    out: List[Tuple[str, str, int, Optional[str]]] = []
+    for title, items in groups.items():
+        messages = [m for _t, m, _to, _a in items]
+        text = "\n".join(messages[:_MAX_LINES])
+        if len(messages) > _MAX_LINES:
+            text += f"\n(+{len(messages) - _MAX_LINES})"
+        _first_title, _m, timeout, app_name = items[0]
+        out.append((title, text, timeout, app_name))
+    return out
+
+
+def _worker_loop() -> None:
+    while True:
+        batch = [_queue.get()]
+        # Fixed window from the first message, so a steady stream can't
+        # postpone delivery forever.
+        deadline = time.monotonic() + _COALESCE_SEC
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        for title, message, timeout, app_name in _merge(batch):
+            _emit(title, message, timeout, app_name)
+
+
+def _ensure_worker() -> None:
+    global _worker
+    if _worker is not None:
+        return
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_worker_loop, name="WinAssocGuardNotify", daemon=True)
+            _worker.start()
+
+
+def notify(title: str, message: str, timeout: int = 5, app_name: Optional[str] = None) -> None:
+    if _notify_fn is None:
+        return
+    _ensure_worker()
+    try:
+        _queue.put_nowait((title, message, timeout, app_name))
+    except queue.Full:
+        pass
+
+
+@functools.lru_cache(maxsize=256)
+def _prebuilt(lang: str, key: str) -> str:
+    # Unformatted template for (lang, key); placeholders are filled per call.
+    return t(lang, key)
+
+
+def notify_key(lang: str, title_key: str, msg_key: str, timeout: int = 5, **fmt: Any) -> None:
+    """
+    Like `notify`, but resolves title/message from i18n keys via a per-(lang, key) cache.
+    """
+    if _notify_fn is None:
+        return
+    title = _prebuilt(lang, title_key)
+    message = _prebuilt(lang, msg_key)
+    if fmt and "{" in message:
+        try:
+            message = message.format_map(fmt)
+        except Exception:
+            pass
+    notify(title=title, message=message, timeout=timeout, app_name=title)
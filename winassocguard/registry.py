@@ -13,24 +13,105 @@ This works in many real-world cases, but Windows can be stubborn in some setups.
 
 from __future__ import annotations
 
+import atexit
+import functools
 import re
+import string
 import sys
+import threading
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
 
 if sys.platform != "win32":
     raise RuntimeError("Windows-only module")
 
+import ctypes
+import ctypes.wintypes as wt
 import winreg
 
 # SHChangeNotify constants
 SHCNE_ASSOCCHANGED = 0x08000000
 SHCNF_IDLIST = 0x0000
 
+# RegNotifyChangeKeyValue constants
+KEY_NOTIFY = 0x0010
+REG_NOTIFY_CHANGE_NAME = 0x00000001
+REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+
+FILEEXTS_SUBKEY = r"Software\Microsoft\Windows\CurrentVersion\Explorer\FileExts"
+HKCU_CLASSES_SUBKEY = r"Software\Classes"
+
+# AssocQueryStringW constants
+ASSOCF_NOTRUNCATE = 0x00000020
+ASSOCSTR_FRIENDLYAPPNAME = 4
+E_POINTER = 0x80004003
+HRESULT_INSUFFICIENT_BUFFER = 0x8007007A  # HRESULT_FROM_WIN32(ERROR_INSUFFICIENT_BUFFER)
+
+# Shell API bindings, resolved once. None if unavailable (callers fall back).
+try:
+    _SHLWAPI = ctypes.WinDLL("Shlwapi", use_last_error=True)
+    _SHLoadIndirectStringW = _SHLWAPI.SHLoadIndirectStringW
+    _SHLoadIndirectStringW.argtypes = [wt.LPCWSTR, wt.LPWSTR, wt.UINT, wt.LPVOID]
+    _SHLoadIndirectStringW.restype = ctypes.HRESULT
+    _AssocQueryStringW = _SHLWAPI.AssocQueryStringW
+    _AssocQueryStringW.argtypes = [
+        wt.DWORD,  # ASSOCF
+        wt.DWORD,  # ASSOCSTR
+        wt.LPCWSTR,  # pszAssoc
+        wt.LPCWSTR,  # pszExtra
+        wt.LPWSTR,  # pszOut
+        wt.LPDWORD,  # pcchOut
+    ]
+    _AssocQueryStringW.restype = ctypes.HRESULT
+except (OSError, AttributeError):
+    _SHLWAPI = None
+    _SHLoadIndirectStringW = None
+    _AssocQueryStringW = None
+
+# Whole-tree delete in one call; `_delete_key_tree` falls back to a winreg walk.
+ERROR_SUCCESS = 0
+ERROR_FILE_NOT_FOUND = 2
+try:
+    _SHDeleteKeyW = _SHLWAPI.SHDeleteKeyW
+    _SHDeleteKeyW.argtypes = [wt.HKEY, wt.LPCWSTR]
+    _SHDeleteKeyW.restype = wt.LONG
+except AttributeError:  # also covers _SHLWAPI being None
+    _SHDeleteKeyW = None
+
+# Direct advapi32 reads for the hottest lookups (skip PyHKEY wrappers).
+REG_SZ = 1
+REG_EXPAND_SZ = 2
+try:
+    _ADVAPI32 = ctypes.WinDLL("advapi32", use_last_error=True)
+    _RegOpenKeyExW = _ADVAPI32.RegOpenKeyExW
+    _RegOpenKeyExW.argtypes = [wt.HKEY, wt.LPCWSTR, wt.DWORD, wt.DWORD, ctypes.POINTER(wt.HKEY)]
+    _RegOpenKeyExW.restype = wt.LONG
+    _RegQueryValueExW = _ADVAPI32.RegQueryValueExW
+    _RegQueryValueExW.argtypes = [wt.HKEY, wt.LPCWSTR, wt.LPDWORD, wt.LPDWORD, ctypes.c_void_p, wt.LPDWORD]
+    _RegQueryValueExW.restype = wt.LONG
+    _RegCloseKey = _ADVAPI32.RegCloseKey
+    _RegCloseKey.argtypes = [wt.HKEY]
+    _RegCloseKey.restype = wt.LONG
+except (OSError, AttributeError):
+    _RegQueryValueExW = None
+
+try:
+    _SHChangeNotify = ctypes.WinDLL("shell32", use_last_error=True).SHChangeNotify
+    _SHChangeNotify.argtypes = [wt.LONG, wt.UINT, wt.LPVOID, wt.LPVOID]
+    _SHChangeNotify.restype = None
+except (OSError, AttributeError):
+    _SHChangeNotify = None
+
 
 _EXT_RE = re.compile(r"^\.[A-Za-z0-9][A-Za-z0-9._+\-]*$")
+_EXT_RE_MATCH = _EXT_RE.match
+# Same rule as _EXT_RE for (already lowercased) ASCII input, without the regex engine.
+_EXT_FIRST_CHARS = frozenset(string.ascii_lowercase + string.digits)
+_EXT_CHARS = _EXT_FIRST_CHARS | frozenset("._+-")
 
 
 def normalize_ext(ext: str) -> str:
@@ -42,39 +123,53 @@ def normalize_ext(ext: str) -> str:
     return ext.lower()
 
 
+def normalize_and_validate(ext: str) -> Optional[str]:
+    """
+    `normalize_ext` + `is_valid_ext` in one call: normalized ext, or None if invalid.
+    """
+    ext = (ext or "").strip()
+    if not ext:
+        return None
+    if ext[0] != ".":
+        ext = "." + ext
+    ext = ext.lower()
+    if ext.isascii():
+        ok = len(ext) >= 2 and ext[1] in _EXT_FIRST_CHARS and _EXT_CHARS.issuperset(ext)
+        return ext if ok else None
+    return ext if _EXT_RE_MATCH(ext) else None
+
+
 def is_valid_ext(ext: str) -> bool:
-    ext = normalize_ext(ext)
-    return bool(_EXT_RE.match(ext))
+    return normalize_and_validate(ext) is not None
 
 
-def _read_value(root, subkey: str, value_name: str) -> Optional[str]:
-    if value_name == "":
-        value_name = None
+def _open_and_read(root, subkey: str, value_names: Tuple[Optional[str], ...]) -> Dict[Optional[str], Optional[str]]:
+    """
+    Open `subkey` once and read several string values ("" / None = default value).
+    Missing, empty or non-string values map to None.
+    """
+    out: Dict[Optional[str], Optional[str]] = dict.fromkeys(value_names)
     try:
         with winreg.OpenKey(root, subkey, 0, winreg.KEY_READ) as k:
-            val, _typ = winreg.QueryValueEx(k, value_name)
-            if isinstance(val, str) and val.strip():
-                return val.strip()
-            return None
-    except FileNotFoundError:
-        return None
+            for name in value_names:
+                out[name] = _query_str(k, name or None)
     except OSError:
-        return None
+        pass
+    return out
 
 
-def _has_value_name(root, subkey: str, value_name: str) -> bool:
-    if value_name == "":
-        value_name = None
-    try:
-        with winreg.OpenKey(root, subkey, 0, winreg.KEY_READ) as k:
-            winreg.QueryValueEx(k, value_name)
-            return True
-    except FileNotFoundError:
-        return False
-    except OSError:
-        return False
+def _read_value(root, subkey: str, value_name: str) -> Optional[str]:
+    return _open_and_read(root, subkey, (value_name,))[value_name]
+
 
+def _exe_basename(path: str) -> str:
+    # Fast path for the usual `...\app.exe`; Path handles everything else.
+    if path[-4:].lower() == ".exe":
+        return path.replace("/", "\\").rsplit("\\", 1)[-1]
+    return Path(path).name
 
+
+@functools.lru_cache(maxsize=512)
 def _extract_exe_from_command(command: str) -> Optional[str]:
     """
     Best effort to extract the executable path/name from a command string.
@@ -91,11 +186,13 @@ def _extract_exe_from_command(command: str) -> Optional[str]:
         if end > 1:
             exe = s[1:end].strip()
             if exe:
-                return Path(exe).name
+                return _exe_basename(exe)
 
     # Unquoted first token
     token = s.split()[0]
     if token:
+        if token[-4:].lower() == ".exe":
+            return _exe_basename(token)
         try:
             p = Path(token)
             if p.suffix:
@@ -116,68 +213,67 @@ def _resolve_resource_string(value: str) -> Optional[str]:
     if not s.startswith("@"):
         return None
 
-    try:
-        import ctypes
-        import ctypes.wintypes as wt
-
-        shlwapi = ctypes.WinDLL("Shlwapi", use_last_error=True)
-        load_str = shlwapi.SHLoadIndirectStringW
-        load_str.argtypes = [wt.LPCWSTR, wt.LPWSTR, wt.UINT, wt.LPVOID]
-        load_str.restype = ctypes.HRESULT
-
-        # Expected format: @path,-id
-        required = 1024
-        buf = ctypes.create_unicode_buffer(required)
-        hr = load_str(s, buf, required, None)
-        if hr == 0:
-            txt = (buf.value or "").strip()
-            return txt or None
-    except Exception:
+    if _SHLoadIndirectStringW is None:
         return None
+
+    # Expected format: @path,-id. Most strings fit MAX_PATH; retry larger
+    # once if the call fails or the result fills the buffer (may be truncated).
+    for size in (260, 1024):
+        try:
+            buf = ctypes.create_unicode_buffer(size)
+            hr = _SHLoadIndirectStringW(s, buf, size, None)
+        except OSError:
+            continue
+        if hr != 0:
+            return None
+        txt = buf.value or ""
+        if len(txt) >= size - 1 and size < 1024:
+            continue
+        return txt.strip() or None
     return None
 
 
+@functools.lru_cache(maxsize=1024)
 def _assoc_query_friendly_name(progid_or_ext: str) -> Optional[str]:
     """
     Use Windows shell association API to get a friendly handler name.
     This often gives a readable app name for both desktop and UWP-like IDs.
     """
-    try:
-        import ctypes
-        import ctypes.wintypes as wt
-
-        shlwapi = ctypes.WinDLL("Shlwapi", use_last_error=True)
-        query = shlwapi.AssocQueryStringW
-        query.argtypes = [
-            wt.DWORD,  # ASSOCF
-            wt.DWORD,  # ASSOCSTR
-            wt.LPCWSTR,  # pszAssoc
-            wt.LPCWSTR,  # pszExtra
-            wt.LPWSTR,  # pszOut
-            wt.LPDWORD,  # pcchOut
-        ]
-        query.restype = ctypes.HRESULT
-
-        ASSOCF_NONE = 0
-        ASSOCSTR_FRIENDLYAPPNAME = 4
-
-        required = wt.DWORD(0)
-        hr = query(ASSOCF_NONE, ASSOCSTR_FRIENDLYAPPNAME, progid_or_ext, "open", None, ctypes.byref(required))
-        if hr not in (0, 1):  # not S_OK / S_FALSE
-            return None
+    query = _AssocQueryStringW
+    if query is None:
+        return None
 
-        if not required.value:
+    # One call with a buffer that fits nearly every name; NOTRUNCATE makes the
+    # API report the needed size instead of truncating, so retry once with it.
+    size = 512
+    for _attempt in range(2):
+        buf = ctypes.create_unicode_buffer(size)
+        required = wt.DWORD(size)
+        try:
+            hr = query(ASSOCF_NOTRUNCATE, ASSOCSTR_FRIENDLYAPPNAME, progid_or_ext, "open", buf, ctypes.byref(required))
+        except OSError as e:
+            # The HRESULT restype raises on failure codes.
+            code = (e.winerror or 0) & 0xFFFFFFFF
+            if code not in (E_POINTER, HRESULT_INSUFFICIENT_BUFFER) or required.value <= size:
+                return None
+            size = required.value
+            continue
+        except Exception:
             return None
-        buf = ctypes.create_unicode_buffer(required.value)
-        hr = query(ASSOCF_NONE, ASSOCSTR_FRIENDLYAPPNAME, progid_or_ext, "open", buf, ctypes.byref(required))
         if hr != 0:
             return None
         txt = (buf.value or "").strip()
         return txt or None
-    except Exception:
-        return None
+    return None
+
 
+def _progid_open_exe(progid: str) -> Optional[str]:
+    # Registry paths are case-insensitive, so shell\open and shell\Open are one key.
+    cmd = _read_value(winreg.HKEY_CLASSES_ROOT, progid + "\\shell\\open\\command", "")
+    return _extract_exe_from_command(cmd) if cmd else None
 
+
+@functools.lru_cache(maxsize=1024)
 def get_progid_display_name(progid: str) -> str:
     """
     Return a human-friendly program name for a ProgId.
@@ -187,8 +283,10 @@ def get_progid_display_name(progid: str) -> str:
     if not progid:
         return ""
 
-    # Common location for a readable name.
-    display = _read_default_value(winreg.HKEY_CLASSES_ROOT, progid)
+    # Default value (common location for a readable name) and FriendlyTypeName
+    # (some registrations expose it) share one open of HKCR\<ProgId>.
+    vals = _open_and_read(winreg.HKEY_CLASSES_ROOT, progid, (None, "FriendlyTypeName"))
+    display = vals[None]
     if display:
         resolved = _resolve_resource_string(display)
         if resolved:
@@ -200,22 +298,15 @@ def get_progid_display_name(progid: str) -> str:
     if shell:
         return shell
 
-    # Some registrations expose FriendlyTypeName in a known value.
-    display = _read_value(winreg.HKEY_CLASSES_ROOT, progid, "FriendlyTypeName")
+    display = vals["FriendlyTypeName"]
     if display:
         return display
 
     # Fallback: parse open command executable name, e.g. chrome.exe / path.
-    for suffix in ("shell\\open\\command", "shell\\Open\\command"):
-        cmd = _read_value(winreg.HKEY_CLASSES_ROOT, f"{progid}\\{suffix}", "")
-        if cmd:
-            exe = _extract_exe_from_command(cmd)
-            if exe:
-                return exe
-
-    return progid
+    return _progid_open_exe(progid) or progid
 
 
+@functools.lru_cache(maxsize=1024)
 def get_progid_app_name(progid: str) -> str:
     """
     Best-effort app name for a ProgId, preferring Windows association metadata.
@@ -233,16 +324,10 @@ def get_progid_app_name(progid: str) -> str:
         if app:
             return app
 
-    for suffix in ("shell\\open\\command", "shell\\Open\\command"):
-        cmd = _read_value(winreg.HKEY_CLASSES_ROOT, f"{progid}\\{suffix}", "")
-        if cmd:
-            exe = _extract_exe_from_command(cmd)
-            if exe:
-                return exe
-
-    return ""
+    return _progid_open_exe(progid) or ""
 
 
+@functools.lru_cache(maxsize=1024)
 def format_progid_for_picker(progid: str) -> str:
     """
     Display used in app picker: prefer app name, then file-type name.
@@ -257,6 +342,7 @@ def format_progid_for_picker(progid: str) -> str:
     return app or typ or progid
 
 
+@functools.lru_cache(maxsize=1024)
 def format_progid_for_display(progid: str) -> str:
     """
     Display value used in UI: Friendly name + original ID for traceability.
@@ -270,58 +356,78 @@ def format_progid_for_display(progid: str) -> str:
     return progid
 
 
-def _list_value_names(root, subkey: str) -> list[str]:
-    out: list[str] = []
+def _enum_key(root, subkey: str) -> Tuple[list[str], list[Tuple[str, object]]]:
+    """
+    Open `subkey` once and return (subkey names, [(value name, data), ...]).
+    Counts come from QueryInfoKey; missing/unreadable keys yield empty lists.
+    """
+    if root is None:
+        return [], []
+    subkeys: list[str] = []
+    values: list[Tuple[str, object]] = []
     try:
         with winreg.OpenKey(root, subkey, 0, winreg.KEY_READ) as k:
-            i = 0
-            while True:
-                try:
-                    name, _val, _typ = winreg.EnumValue(k, i)
-                    i += 1
-                except OSError:
-                    break
-                if isinstance(name, str) and name.strip():
-                    out.append(name.strip())
-    except Exception:
-        return []
-    return out
+            n_sub, n_val, _ts = winreg.QueryInfoKey(k)
+            try:
+                for i in range(n_sub):
+                    subkeys.append(winreg.EnumKey(k, i))
+                for i in range(n_val):
+                    name, val, _typ = winreg.EnumValue(k, i)
+                    values.append((name, val))
+            except OSError:
+                pass  # key shrank while enumerating; keep what we have
+    except OSError:
+        return [], []
+    return subkeys, values
 
 
-def _list_string_values(root, subkey: str) -> list[str]:
-    out: list[str] = []
-    try:
-        with winreg.OpenKey(root, subkey, 0, winreg.KEY_READ) as k:
-            i = 0
-            while True:
-                try:
-                    _name, val, _typ = winreg.EnumValue(k, i)
-                    i += 1
-                except OSError:
-                    break
-                if isinstance(val, str) and val.strip():
-                    out.append(val.strip())
-    except Exception:
-        return []
-    return out
+def _clean_names(names) -> list[str]:
+    return [n.strip() for n in names if isinstance(n, str) and n.strip()]
 
 
-def _list_subkeys(root, subkey: str) -> list[str]:
-    out: list[str] = []
-    try:
-        with winreg.OpenKey(root, subkey, 0, winreg.KEY_READ) as k:
-            i = 0
-            while True:
-                try:
-                    name = winreg.EnumKey(k, i)
-                    i += 1
-                except OSError:
-                    break
-                if isinstance(name, str) and name.strip():
-                    out.append(name.strip())
-    except Exception:
-        return []
-    return out
+_APPLICATIONS_INDEX: Optional[Dict[str, list[str]]] = None
+_APPLICATIONS_INDEX_LOCK = threading.Lock()
+
+
+def _build_applications_index() -> Dict[str, list[str]]:
+    """
+    Invert HKCR\\Applications\\*\\SupportedTypes into {ext: [Applications\\<app>, ...]},
+    in registry enumeration order.
+    """
+    index: Dict[str, list[str]] = {}
+    with _cached_key(winreg.HKEY_CLASSES_ROOT, "Applications") as apps:
+        app_names, _vals = _enum_key(apps, "")
+        for app_name in _clean_names(app_names):
+            _subs, types = _enum_key(apps, app_name + "\\SupportedTypes")
+            progid = "Applications\\" + app_name
+            for name, _val in types:
+                if not isinstance(name, str):
+                    continue
+                extn = name.strip().lower()
+                if extn:
+                    index.setdefault(extn, []).append(progid)
+    return index
+
+
+def _applications_index() -> Dict[str, list[str]]:
+    # Built on first use; dropped by _invalidate_caches() / invalidate_applications_index().
+    global _APPLICATIONS_INDEX
+    index = _APPLICATIONS_INDEX
+    if index is None:
+        with _APPLICATIONS_INDEX_LOCK:
+            index = _APPLICATIONS_INDEX
+            if index is None:
+                index = _APPLICATIONS_INDEX = _build_applications_index()
+    return index
+
+
+def invalidate_applications_index() -> None:
+    """
+    Rebuild the Applications index on next use. HKLM installs don't trip the
+    HKCU watcher, so callers drop it whenever the app picker is opened.
+    """
+    global _APPLICATIONS_INDEX
+    _APPLICATIONS_INDEX = None
 
 
 def list_candidate_progids_for_ext(ext: str, limit: int = 24) -> list[str]:
@@ -331,6 +437,7 @@ def list_candidate_progids_for_ext(ext: str, limit: int = 24) -> list[str]:
     ext = normalize_ext(ext)
     if not is_valid_ext(ext):
         return []
+    limit = max(1, int(limit))
 
     seen: set[str] = set()
     out: list[str] = []
@@ -350,81 +457,116 @@ def list_candidate_progids_for_ext(ext: str, limit: int = 24) -> list[str]:
     add_candidate(get_hkcu_classes_progid(ext))
     add_candidate(get_hkcr_progid(ext))
 
-    # Windows "Open with" MRU ProgIds (value names are ProgIds).
-    add_candidate_list = _list_value_names(
-        winreg.HKEY_CURRENT_USER,
-        fr"Software\Microsoft\Windows\CurrentVersion\Explorer\FileExts\{ext}\OpenWithProgids",
-    )
-    for progid in add_candidate_list:
-        add_candidate(progid)
+    with _cached_key(winreg.HKEY_CURRENT_USER, FILEEXTS_SUBKEY) as fileexts:
+        _subs, user_progids = _enum_key(fileexts, ext + "\\OpenWithProgids")
+        _subs, user_list = _enum_key(fileexts, ext + "\\OpenWithList")
+    _subs, global_progids = _enum_key(winreg.HKEY_CLASSES_ROOT, ext + "\\OpenWithProgids")
+    _subs, global_list = _enum_key(winreg.HKEY_CLASSES_ROOT, ext + "\\OpenWithList")
 
-    # Global extension-level OpenWithProgids.
-    add_candidate_list = _list_value_names(winreg.HKEY_CLASSES_ROOT, fr"{ext}\OpenWithProgids")
-    for progid in add_candidate_list:
+    # Windows "Open with" MRU ProgIds (value names are ProgIds), then the
+    # global extension-level OpenWithProgids.
+    for progid in _clean_names(name for name, _val in user_progids + global_progids):
         add_candidate(progid)
 
     # OpenWithList stores executable names; map them to Applications\<exe>.
-    for exe in _list_string_values(
-        winreg.HKEY_CURRENT_USER,
-        fr"Software\Microsoft\Windows\CurrentVersion\Explorer\FileExts\{ext}\OpenWithList",
-    ):
-        add_candidate(fr"Applications\{exe}")
-    for exe in _list_string_values(winreg.HKEY_CLASSES_ROOT, fr"{ext}\OpenWithList"):
+    for exe in _clean_names(val for _name, val in user_list + global_list):
         add_candidate(fr"Applications\{exe}")
 
     # Registered applications that explicitly list this extension.
-    if len(out) < max(1, int(limit)):
-        for app_name in _list_subkeys(winreg.HKEY_CLASSES_ROOT, "Applications"):
-            if len(out) >= max(1, int(limit)):
+    if len(out) < limit:
+        for progid in _applications_index().get(ext, ()):
+            if len(out) >= limit:
+                break
+            add_candidate(progid)
+
+    return out[:limit]
+
+
+def enumerate_userchoice_progids() -> list[Tuple[str, str]]:
+    """
+    One pass over HKCU FileExts returning (ext, progid) for every extension
+    that has a `UserChoice` subkey, sorted by ext.
+
+    Equivalent to `get_effective_progid` for each such ext, but each
+    UserChoice key is opened once. If UserChoice has no ProgId value,
+    the HKCU Classes / HKCR fallback is used (progid may then be "").
+    """
+    found: dict[str, str] = {}
+    with _cached_key(winreg.HKEY_CURRENT_USER, FILEEXTS_SUBKEY) as fileexts:
+        if fileexts is None:
+            return []
+        i = 0
+        while True:
+            try:
+                name = winreg.EnumKey(fileexts, i)
+                i += 1
+            except OSError:
                 break
-            supported_types_key = fr"Applications\{app_name}\SupportedTypes"
-            if _has_value_name(winreg.HKEY_CLASSES_ROOT, supported_types_key, ext):
-                add_candidate(fr"Applications\{app_name}")
 
-    return out[: max(1, int(limit))]
+            if not name or not name.startswith("."):
+                continue
+            extn = normalize_ext(name)
+            if not is_valid_ext(extn) or extn in found:
+                continue
 
+            try:
+                with winreg.OpenKey(fileexts, name + "\\UserChoice", 0, winreg.KEY_READ) as k:
+                    progid = _query_str(k, "ProgId")
+            except OSError:
+                continue  # no UserChoice
+            if not progid:
+                progid = get_hkcu_classes_progid(extn) or get_hkcr_progid(extn)
+            found[extn] = progid or ""
 
-def list_user_fileexts(only_userchoice: bool = True) -> list[str]:
-    '''
-    Enumerate file extensions from:
-      HKCU\\Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\FileExts
+    return sorted(found.items())
 
-    - If `only_userchoice` is True (default), return only extensions that have a
-      `UserChoice` subkey (meaning the user explicitly set a default app at least once).
 
-    This is useful for a one-click "import my current defaults" UX.
-    '''
-    base = r"Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\FileExts"
-    out: list[str] = []
-    try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, base, 0, winreg.KEY_READ) as k:
-            i = 0
-            while True:
-                try:
-                    name = winreg.EnumKey(k, i)
-                    i += 1
-                except OSError:
-                    break
-
-                if not name or not name.startswith('.'):
-                    continue
+_READ_BUF_CHARS = 512
+_read_tls = threading.local()
 
-                extn = normalize_ext(name)
-                if not is_valid_ext(extn):
-                    continue
 
-                if only_userchoice:
-                    uc = base + "\\" + name + "\\UserChoice"
-                    if not _key_exists(winreg.HKEY_CURRENT_USER, uc):
-                        continue
+def _fast_read_str(root, subkey: str, value_name: Optional[str]) -> Optional[str]:
+    """
+    Read a string value via advapi32 into a reused per-thread buffer.
 
-                out.append(extn)
-    except Exception:
-        return []
+    Returns the stripped string, or None if the key/value is missing, empty
+    or not a string. Raises OSError when the winreg path should be used
+    instead (bindings missing, value too large, other errors).
+    """
+    if _RegQueryValueExW is None:
+        raise OSError("advapi32 bindings unavailable")
+    buf = getattr(_read_tls, "buf", None)
+    if buf is None:
+        buf = _read_tls.buf = ctypes.create_unicode_buffer(_READ_BUF_CHARS)
+
+    hk = wt.HKEY()
+    rc = _RegOpenKeyExW(int(root), subkey, 0, winreg.KEY_READ, ctypes.byref(hk))
+    if rc == ERROR_FILE_NOT_FOUND:
+        return None
+    if rc != ERROR_SUCCESS:
+        raise ctypes.WinError(rc)
+    try:
+        typ = wt.DWORD(0)
+        cb = wt.DWORD(ctypes.sizeof(buf))
+        rc = _RegQueryValueExW(hk, value_name, None, ctypes.byref(typ), buf, ctypes.byref(cb))
+    finally:
+        _RegCloseKey(hk)
+    if rc == ERROR_FILE_NOT_FOUND:
+        return None
+    if rc != ERROR_SUCCESS:
+        raise ctypes.WinError(rc)  # incl. ERROR_MORE_DATA
+    if typ.value not in (REG_SZ, REG_EXPAND_SZ):
+        return None
+    # Data need not be NUL-terminated; take exactly cb bytes.
+    val = ctypes.wstring_at(buf, cb.value // ctypes.sizeof(ctypes.c_wchar)).split("\0", 1)[0].strip()
+    return val or None
 
-    return sorted(set(out))
 
 def _read_default_value(root, subkey: str) -> Optional[str]:
+    try:
+        return _fast_read_str(root, subkey, None)
+    except OSError:
+        pass
     try:
         with winreg.OpenKey(root, subkey, 0, winreg.KEY_READ) as k:
             try:
@@ -450,29 +592,135 @@ def _key_exists(root, subkey: str) -> bool:
         return False
 
 
+def _query_str(key, value_name: Optional[str]) -> Optional[str]:
+    try:
+        val, _typ = winreg.QueryValueEx(key, value_name)
+    except OSError:
+        return None
+    if isinstance(val, str) and val.strip():
+        return val.strip()
+    return None
+
+
+def _query_subkey_str(parent, subkey: str, value_name: Optional[str]) -> Optional[str]:
+    if parent is None:
+        return None
+    try:
+        with winreg.OpenKey(parent, subkey, 0, winreg.KEY_READ) as k:
+            return _query_str(k, value_name)
+    except OSError:
+        return None
+
+
+# Long-lived handles to parent keys (FileExts, HKCU Classes), keyed by
+# (root, subkey, access). Per-extension keys are opened relative to these.
+# Handles are borrowed through _cached_key(); one dropped from the cache
+# (LRU eviction or invalidate_handle_cache) is closed only after its last
+# borrower is done, so a closed handle value is never used by another thread.
+class _CachedHandle:
+    __slots__ = ("hkey", "users", "retired")
+
+    def __init__(self, hkey) -> None:
+        self.hkey = hkey
+        self.users = 0
+        self.retired = False
+
+
+_HANDLE_CACHE: "OrderedDict[tuple, _CachedHandle]" = OrderedDict()
+_HANDLE_CACHE_LOCK = threading.Lock()
+_HANDLE_CACHE_MAX = 64
+
+
+def _close_hkeys(entries: Iterable[_CachedHandle]) -> None:
+    for entry in entries:
+        try:
+            entry.hkey.Close()
+        except Exception:
+            pass
+
+
+def _retire(entry: _CachedHandle) -> bool:
+    # Caller holds _HANDLE_CACHE_LOCK. True if nobody is using it: close now.
+    entry.retired = True
+    return entry.users == 0
+
+
+@contextmanager
+def _cached_key(root, subkey: str, access: int = winreg.KEY_READ) -> Iterator[Optional["winreg.HKEYType"]]:
+    """
+    Borrow a (possibly cached) handle for the `with` block; yields None if
+    the key can't be opened. The caller must not close it.
+    """
+    cache_key = (int(root), subkey.lower(), access)
+    evicted: list[_CachedHandle] = []
+    with _HANDLE_CACHE_LOCK:
+        entry = _HANDLE_CACHE.get(cache_key)
+        if entry is not None:
+            _HANDLE_CACHE.move_to_end(cache_key)
+        else:
+            try:
+                if access & winreg.KEY_CREATE_SUB_KEY:
+                    hkey = winreg.CreateKeyEx(root, subkey, 0, access)
+                else:
+                    hkey = winreg.OpenKey(root, subkey, 0, access)
+            except OSError:
+                hkey = None
+            if hkey is not None:
+                entry = _HANDLE_CACHE[cache_key] = _CachedHandle(hkey)
+                while len(_HANDLE_CACHE) > _HANDLE_CACHE_MAX:
+                    _k, old = _HANDLE_CACHE.popitem(last=False)
+                    if _retire(old):
+                        evicted.append(old)
+        if entry is not None:
+            entry.users += 1
+    _close_hkeys(evicted)
+
+    if entry is None:
+        yield None
+        return
+    try:
+        yield entry.hkey
+    finally:
+        with _HANDLE_CACHE_LOCK:
+            entry.users -= 1
+            last = entry.retired and entry.users == 0
+        if last:
+            _close_hkeys((entry,))
+
+
+def invalidate_handle_cache() -> None:
+    """
+    Drop all cached handles (e.g. after a watched parent key was recreated).
+    Handles still borrowed elsewhere are closed when released.
+    """
+    with _HANDLE_CACHE_LOCK:
+        idle = [entry for entry in _HANDLE_CACHE.values() if _retire(entry)]
+        _HANDLE_CACHE.clear()
+    _close_hkeys(idle)
+
+
+atexit.register(invalidate_handle_cache)
+
+
 def get_userchoice_progid(ext: str) -> Optional[str]:
     ext = normalize_ext(ext)
     if not ext:
         return None
-    subkey = fr"Software\Microsoft\Windows\CurrentVersion\Explorer\FileExts\{ext}\UserChoice"
-    try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, subkey, 0, winreg.KEY_READ) as k:
-            val, _typ = winreg.QueryValueEx(k, "ProgId")
-            if isinstance(val, str) and val.strip():
-                return val.strip()
+    with _cached_key(winreg.HKEY_CURRENT_USER, FILEEXTS_SUBKEY) as fileexts:
+        if fileexts is None:
             return None
-    except FileNotFoundError:
-        return None
-    except OSError:
-        return None
+        try:
+            return _fast_read_str(fileexts, ext + "\\UserChoice", "ProgId")
+        except OSError:
+            return _query_subkey_str(fileexts, ext + "\\UserChoice", "ProgId")
 
 
 def get_hkcu_classes_progid(ext: str) -> Optional[str]:
     ext = normalize_ext(ext)
     if not ext:
         return None
-    subkey = fr"Software\Classes\{ext}"
-    return _read_default_value(winreg.HKEY_CURRENT_USER, subkey)
+    with _cached_key(winreg.HKEY_CURRENT_USER, HKCU_CLASSES_SUBKEY) as classes:
+        return _query_subkey_str(classes, ext, None)
 
 
 def get_hkcr_progid(ext: str) -> Optional[str]:
@@ -499,12 +747,49 @@ def get_effective_progid(ext: str) -> Optional[str]:
     return get_hkcr_progid(ext)
 
 
+def batch_get_effective_progids(exts: Sequence[str]) -> Dict[str, Optional[str]]:
+    """
+    Same chain as `get_effective_progid`, for many extensions at once.
+
+    Parent keys (HKCU FileExts / HKCU Classes) come from the handle cache and
+    each extension is read relative to them, instead of re-opening full paths.
+    Keys of the returned dict are the inputs as given.
+    """
+    out: Dict[str, Optional[str]] = {}
+    with _cached_key(winreg.HKEY_CURRENT_USER, FILEEXTS_SUBKEY) as fileexts, _cached_key(
+        winreg.HKEY_CURRENT_USER, HKCU_CLASSES_SUBKEY
+    ) as classes:
+        for ext in exts:
+            extn = normalize_ext(ext)
+            if not extn:
+                out[ext] = None
+                continue
+            out[ext] = (
+                _query_subkey_str(fileexts, extn + "\\UserChoice", "ProgId")
+                or _query_subkey_str(classes, extn, None)
+                or _query_subkey_str(winreg.HKEY_CLASSES_ROOT, extn, None)
+            )
+    return out
+
+
+# Lowercased ProgIds already confirmed under HKCR. Only hits are kept: a miss
+# is always re-checked, since a ProgId may be registered later in a key the
+# watcher doesn't cover (e.g. HKLM\Software\Classes). Cleared by _invalidate_caches().
+_VALID_PROGIDS: set[str] = set()
+
+
 def is_progid_valid(progid: str) -> bool:
     progid = (progid or "").strip()
     if not progid:
         return False
+    key = progid.lower()
+    if key in _VALID_PROGIDS:
+        return True
     # ProgId keys typically live under HKCR\<ProgId>
-    return _key_exists(winreg.HKEY_CLASSES_ROOT, progid)
+    if _key_exists(winreg.HKEY_CLASSES_ROOT, progid):
+        _VALID_PROGIDS.add(key)
+        return True
+    return False
 
 
 def set_hkcu_classes_ext_default(ext: str, progid: str) -> None:
@@ -512,31 +797,14 @@ def set_hkcu_classes_ext_default(ext: str, progid: str) -> None:
     progid = (progid or "").strip()
     if not ext or not progid:
         return
-    subkey = fr"Software\Classes\{ext}"
-    with winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, subkey, 0, winreg.KEY_SET_VALUE) as k:
-        winreg.SetValueEx(k, None, 0, winreg.REG_SZ, progid)
+    with _cached_key(winreg.HKEY_CURRENT_USER, HKCU_CLASSES_SUBKEY, winreg.KEY_READ | winreg.KEY_WRITE) as classes:
+        if classes is None:
+            raise OSError(f"cannot open HKCU\\{HKCU_CLASSES_SUBKEY}")
+        with winreg.CreateKeyEx(classes, ext, 0, winreg.KEY_SET_VALUE) as k:
+            winreg.SetValueEx(k, None, 0, winreg.REG_SZ, progid)
 
 
-def _delete_key_tree(root, subkey: str) -> None:
-    """
-    Recursively delete a key. If it doesn't exist, do nothing.
-    """
-    try:
-        with winreg.OpenKey(root, subkey, 0, winreg.KEY_READ | winreg.KEY_WRITE) as k:
-            # Enumerate subkeys first
-            while True:
-                try:
-                    child = winreg.EnumKey(k, 0)
-                    _delete_key_tree(root, subkey + "\\" + child)
-                except OSError:
-                    break
-    except FileNotFoundError:
-        return
-    except OSError:
-        # If we can't open it, try deleting directly.
-        pass
-
-    # Now delete this key
+def _delete_key(root, subkey: str) -> None:
     try:
         winreg.DeleteKey(root, subkey)
     except FileNotFoundError:
@@ -552,42 +820,118 @@ def _delete_key_tree(root, subkey: str) -> None:
                 continue
 
 
+def _delete_key_tree(root, subkey: str) -> None:
+    """
+    Recursively delete a key. If it doesn't exist, do nothing.
+    """
+    if _SHDeleteKeyW is not None:
+        try:
+            rc = _SHDeleteKeyW(int(root), subkey)
+        except Exception:
+            rc = None
+        if rc in (ERROR_SUCCESS, ERROR_FILE_NOT_FOUND):
+            return
+
+    # Fallback: collect the tree parents-first with an explicit stack, then
+    # delete in reverse so children always go before their parent.
+    order: list[str] = []
+    stack = [subkey]
+    while stack:
+        path = stack.pop()
+        order.append(path)
+        try:
+            with winreg.OpenKey(root, path, 0, winreg.KEY_READ) as k:
+                n_sub = winreg.QueryInfoKey(k)[0]
+                for i in range(n_sub):
+                    stack.append(path + "\\" + winreg.EnumKey(k, i))
+        except FileNotFoundError:
+            if path == subkey:
+                return
+        except OSError:
+            # If we can't open it, still try deleting it directly.
+            pass
+
+    for path in reversed(order):
+        _delete_key(root, path)
+
+
 def delete_userchoice(ext: str) -> None:
     ext = normalize_ext(ext)
     if not ext:
         return
-    subkey = fr"Software\Microsoft\Windows\CurrentVersion\Explorer\FileExts\{ext}\UserChoice"
-    _delete_key_tree(winreg.HKEY_CURRENT_USER, subkey)
+    with _cached_key(winreg.HKEY_CURRENT_USER, FILEEXTS_SUBKEY) as fileexts:
+        if fileexts is None:
+            return
+        _delete_key_tree(fileexts, ext + "\\UserChoice")
+
+
+def _invalidate_caches() -> None:
+    """
+    Drop memoized ProgId lookups (names, validity, Applications index); they
+    may be stale once associations change.
+    """
+    for fn in (
+        _extract_exe_from_command,
+        _assoc_query_friendly_name,
+        get_progid_display_name,
+        get_progid_app_name,
+        format_progid_for_picker,
+        format_progid_for_display,
+    ):
+        fn.cache_clear()
+    _VALID_PROGIDS.clear()
+    invalidate_applications_index()
+
+
+_change_subscribers: list[Callable[[], None]] = []
+_change_subscribers_lock = threading.Lock()
+
+
+def subscribe_registry_changes(callback: Callable[[], None]) -> Callable[[], None]:
+    """
+    Call `callback()` whenever the watched per-user association keys change
+    (see `AssocChangeWatcher`). Runs on the watcher's thread, after the
+    lookup caches were dropped. Returns a function that unsubscribes.
+    """
+    with _change_subscribers_lock:
+        _change_subscribers.append(callback)
+
+    def unsubscribe() -> None:
+        with _change_subscribers_lock:
+            try:
+                _change_subscribers.remove(callback)
+            except ValueError:
+                pass
+
+    return unsubscribe
+
+
+def _dispatch_registry_change() -> None:
+    _invalidate_caches()
+    with _change_subscribers_lock:
+        callbacks = tuple(_change_subscribers)
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception:
+            pass
 
 
 def broadcast_assoc_changed() -> None:
     """
     Notify the shell that associations changed.
     """
-    # Try pywin32 first
-    try:
-        import win32gui  # type: ignore
-
-        win32gui.SHChangeNotify(SHCNE_ASSOCCHANGED, SHCNF_IDLIST, None, None)
+    _invalidate_caches()
+    if _SHChangeNotify is None:
         return
-    except Exception:
-        pass
-
-    # Fallback: ctypes
     try:
-        import ctypes
-        import ctypes.wintypes as wt
-
-        shell32 = ctypes.WinDLL("shell32", use_last_error=True)
-        shell32.SHChangeNotify.argtypes = [wt.LONG, wt.UINT, wt.LPVOID, wt.LPVOID]
-        shell32.SHChangeNotify.restype = None
-        shell32.SHChangeNotify(SHCNE_ASSOCCHANGED, SHCNF_IDLIST, None, None)
+        _SHChangeNotify(SHCNE_ASSOCCHANGED, SHCNF_IDLIST, None, None)
     except Exception:
         # Ignore; shell will catch up eventually.
         pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class RestoreResult:
     ext: str
     ok: bool
@@ -596,28 +940,187 @@ class RestoreResult:
     baseline_progid: Optional[str] = None
 
 
-def restore_to_baseline(ext: str, baseline_progid: str) -> RestoreResult:
+def restore_to_baseline(
+    ext: str,
+    baseline_progid: str,
+    *,
+    previous_progid: Optional[str] = None,
+    defer_broadcast: bool = False,
+) -> RestoreResult:
     """
     Restore an extension's association to baseline:
 
     1) Set HKCU\Software\Classes\.ext default -> baseline ProgId
     2) Delete UserChoice to remove per-user override
-    3) Broadcast association change
+    3) Broadcast association change (skipped with `defer_broadcast`; the
+       caller then calls `broadcast_assoc_changed()` once after a batch)
+
+    Pass `previous_progid` if the current effective ProgId is already known
+    to skip reading it again.
     """
-    ext = normalize_ext(ext)
-    baseline_progid = (baseline_progid or "").strip()
-    prev = None
-    try:
-        prev = get_effective_progid(ext)
-        if not ext or not baseline_progid:
-            return RestoreResult(ext=ext, ok=False, error="invalid_args", previous_progid=prev, baseline_progid=baseline_progid)
+    previous = None
+    if previous_progid is not None:
+        previous = {normalize_ext(ext): previous_progid}
+    return restore_many([(ext, baseline_progid)], previous=previous, broadcast=not defer_broadcast)[0]
+
+
+def restore_many(
+    pairs: Iterable[Tuple[str, str]],
+    *,
+    previous: Optional[Mapping[str, Optional[str]]] = None,
+    broadcast: bool = True,
+) -> list[RestoreResult]:
+    """
+    `restore_to_baseline` for many (ext, baseline ProgId) pairs: all writes go
+    through the cached HKCU Classes / FileExts parent handles, then the shell
+    is notified once and each ext is re-checked. Results are in input order.
 
-        set_hkcu_classes_ext_default(ext, baseline_progid)
-        delete_userchoice(ext)
+    `previous` maps normalized ext -> already-known effective ProgId; exts
+    found there are not read again before writing.
+    """
+    # Per pair: [ext, baseline, previous, error]; error None means "written".
+    entries: list[list] = []
+    for ext, baseline_progid in pairs:
+        ext = normalize_ext(ext)
+        baseline_progid = (baseline_progid or "").strip()
+        entry = [ext, baseline_progid, None, None]
+        entries.append(entry)
+        try:
+            if previous is not None and ext in previous:
+                entry[2] = previous[ext]
+            else:
+                entry[2] = get_effective_progid(ext)
+            if not ext or not baseline_progid:
+                entry[3] = "invalid_args"
+                continue
+            set_hkcu_classes_ext_default(ext, baseline_progid)
+            delete_userchoice(ext)
+        except Exception as e:
+            entry[3] = str(e)
+
+    written = any(error is None for _e, _b, _p, error in entries)
+    if written and broadcast:
         broadcast_assoc_changed()
-        # Re-check
-        now = get_effective_progid(ext)
-        ok = (now == baseline_progid) or (now is None)  # None can happen transiently
-        return RestoreResult(ext=ext, ok=ok, error=None if ok else "mismatch_after_restore", previous_progid=prev, baseline_progid=baseline_progid)
-    except Exception as e:
-        return RestoreResult(ext=ext, ok=False, error=str(e), previous_progid=prev, baseline_progid=baseline_progid)
+
+    results: list[RestoreResult] = []
+    for ext, baseline_progid, prev, error in entries:
+        ok = False
+        if error is None:
+            # Re-check only what was touched: UserChoice must be gone (or
+            # already match) and HKCU Classes must hold the baseline. HKCR is
+            # unchanged by a restore.
+            try:
+                uc = get_userchoice_progid(ext)
+                now = get_hkcu_classes_progid(ext)
+                ok = uc in (None, baseline_progid) and now in (None, baseline_progid)  # None can happen transiently
+                error = None if ok else "mismatch_after_restore"
+            except Exception as e:
+                error = str(e)
+        results.append(
+            RestoreResult(ext=ext, ok=ok, error=error, previous_progid=prev, baseline_progid=baseline_progid)
+        )
+    if written and not broadcast:
+        _invalidate_caches()  # broadcast_assoc_changed() already did this
+    return results
+
+
+class AssocChangeWatcher:
+    """
+    Block until per-user association keys change, or a timeout elapses.
+
+    Uses RegNotifyChangeKeyValue on HKCU FileExts (UserChoice lives there) and
+    HKCU\Software\Classes, so the monitor only re-reads the registry when
+    something actually changed. The timeout remains a safety fallback for
+    changes outside the watched keys (e.g. HKLM classes).
+
+    Notifications are bound to the creating thread, so create, wait on and
+    close the watcher from the same (monitor) thread. `wake()` is thread-safe.
+    Each change also drops the lookup caches and runs the callbacks
+    registered with `subscribe_registry_changes`.
+    If pywin32 is unavailable this degrades to a plain timed wait.
+    """
+
+    # Coalesce bursts (Windows writes ProgId + Hash separately).
+    SETTLE_SEC = 0.25
+
+    def __init__(self, stop_event: threading.Event):
+        self._stop_event = stop_event
+        self._keys: list = []
+        self._notify_handle = None
+        self._wake_handle = None
+        try:
+            import win32api  # type: ignore
+            import win32con  # type: ignore
+            import win32event  # type: ignore
+
+            self._notify_handle = win32event.CreateEvent(None, True, False, None)
+            self._wake_handle = win32event.CreateEvent(None, True, False, None)
+            for subkey in (FILEEXTS_SUBKEY, HKCU_CLASSES_SUBKEY):
+                self._keys.append(win32api.RegOpenKeyEx(win32con.HKEY_CURRENT_USER, subkey, 0, KEY_NOTIFY))
+            self._arm()
+        except Exception:
+            self.close()
+
+    @property
+    def native(self) -> bool:
+        return self._notify_handle is not None
+
+    def _arm(self) -> None:
+        import win32api  # type: ignore
+
+        for key in self._keys:
+            win32api.RegNotifyChangeKeyValue(
+                key,
+                True,
+                REG_NOTIFY_CHANGE_NAME | REG_NOTIFY_CHANGE_LAST_SET,
+                self._notify_handle,
+                True,
+            )
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait up to `timeout` seconds. Returns True if a registry change fired.
+        """
+        if not self.native:
+            self._stop_event.wait(timeout)
+            return False
+
+        try:
+            import win32event  # type: ignore
+
+            rc = win32event.WaitForMultipleObjects(
+                [self._notify_handle, self._wake_handle], False, int(timeout * 1000)
+            )
+            if rc != win32event.WAIT_OBJECT_0:
+                return False
+            self._stop_event.wait(self.SETTLE_SEC)
+            win32event.ResetEvent(self._notify_handle)
+            self._arm()
+        except Exception:
+            # Notification broke (e.g. key deleted); keep monitoring by polling.
+            invalidate_handle_cache()
+            self.close()
+            return False
+        _dispatch_registry_change()
+        return True
+
+    def wake(self) -> None:
+        handle = self._wake_handle
+        if handle is None:
+            return
+        try:
+            import win32event  # type: ignore
+
+            win32event.SetEvent(handle)
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        for key in self._keys:
+            try:
+                key.Close()
+            except Exception:
+                pass
+        self._keys = []
+        self._notify_handle = None
+        self._wake_handle = None
@@ -15,7 +15,7 @@ from pystray import Menu as TrayMenu
 from pystray import MenuItem as TrayMenuItem
 
 
-@dataclass
+@dataclass(frozen=True)
 class TrayActions:
     open_panel: Callable[[], None]
     switch_language: Callable[[], None]
@@ -36,21 +36,17 @@ class TrayController:
         self.get_lang = get_lang
         self.tr = tr
         self.actions = actions
-        self.icon = pystray.Icon(self.tr("app_name"), self.image, self.tr("app_name"), self._build_menu())
-
-    def _build_menu(self) -> TrayMenu:
-        # Labels are callables so they re-evaluate when language changes.
-        def label(key: str):
-            return lambda item: self.tr(key)
-
-        return TrayMenu(
-            TrayMenuItem(label("menu_open_panel"), lambda _icon, _item: self.actions.open_panel()),
-            TrayMenuItem(label("menu_switch_lang"), lambda _icon, _item: self.actions.switch_language()),
+        # Built once: labels are callables that re-evaluate on each menu
+        # update, so language switches only need `update_menu()`.
+        self._menu = TrayMenu(
+            TrayMenuItem(lambda _item: self.tr("menu_open_panel"), lambda _icon, _item: self.actions.open_panel()),
+            TrayMenuItem(lambda _item: self.tr("menu_switch_lang"), lambda _icon, _item: self.actions.switch_language()),
         )
+        self.icon = pystray.Icon(self.tr("app_name"), self.image, self.tr("app_name"), self._menu)
 
     def update_menu(self) -> None:
-        self.icon.menu = self._build_menu()
         try:
+            self.icon.title = self.tr("app_name")
             self.icon.update_menu()
         except Exception:
             # On some backends, update_menu is not available or not needed.
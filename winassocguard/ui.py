@@ -13,14 +13,34 @@ This file now includes a compact "Control Panel" page:
 
 from __future__ import annotations
 
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+import itertools
+import queue
 import re
+import sys
+import threading
 
 import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk
 
 
+# Separators accepted in the manual extension box (incl. full-width CJK punctuation).
+_MANUAL_EXT_SPLIT = re.compile(r"[\s,，;；]+")
+
+# How often the Tk thread collects worker results while panel reads are in flight.
+_IO_POLL_MS = 20
+
+# Dialog entry points, bound once.
+_askstring = simpledialog.askstring
+_showinfo = messagebox.showinfo
+_showwarning = messagebox.showwarning
+_showerror = messagebox.showerror
+_askyesno = messagebox.askyesno
+
+
 StatusRow = Tuple[str, str, str]  # (ext, baseline_display, status_key)
 LogRow = Tuple[str, str, str, str]  # (time, ext, event, detail)
 
@@ -33,25 +53,99 @@ class SettingsSnapshot:
     auto_start_enabled: bool
 
 
+# Inserting at least this many rows at once detaches the tree first.
+_BULK_INSERT_MIN = 64
+
+
+@contextmanager
+def _detached(tree: ttk.Treeview) -> Iterator[None]:
+    """
+    Unmap a grid-managed tree and mute its scrollbar updates for a bulk
+    change, so Tk lays it out once when it is re-gridded.
+    """
+    grid_info = tree.grid_info()
+    yscroll = tree.cget("yscrollcommand")
+    if grid_info:
+        tree.grid_forget()
+    tree.configure(yscrollcommand="")
+    try:
+        yield
+    finally:
+        tree.configure(yscrollcommand=yscroll)
+        if grid_info:
+            grid_info.pop("in", None)
+            tree.grid(**grid_info)
+
+
+def _sync_tree(
+    tree: ttk.Treeview,
+    iids: Dict[Hashable, str],
+    last_vals: Dict[Hashable, tuple],
+    new: Dict[Hashable, tuple],
+) -> None:
+    """
+    Make `tree` show `new` (key -> values, in order) by deleting, updating or
+    inserting only the rows that changed. `iids` / `last_vals` are the
+    caller's per-tree caches from the previous call.
+    """
+    inserts = sum(1 for key in new if key not in iids)
+    if inserts >= _BULK_INSERT_MIN:
+        with _detached(tree):
+            _apply_tree_diff(tree, iids, last_vals, new)
+    else:
+        _apply_tree_diff(tree, iids, last_vals, new)
+
+
+def _apply_tree_diff(
+    tree: ttk.Treeview,
+    iids: Dict[Hashable, str],
+    last_vals: Dict[Hashable, tuple],
+    new: Dict[Hashable, tuple],
+) -> None:
+    # Direct Tcl calls: skips ttk's per-call option formatting.
+    tk_call = tree.tk.call
+    w = tree._w
+    removed = iids.keys() - new.keys()
+    gone = [iids.pop(key) for key in removed]
+    for key in removed:
+        last_vals.pop(key, None)
+    if gone:
+        tk_call(w, "delete", tuple(gone))  # takes an item list: one round-trip for all
+    order: List[str] = []
+    for key, vals in new.items():
+        iid = iids.get(key)
+        if iid is None:
+            # Rows before this one are already in place, so this index is final.
+            iid = iids[key] = tk_call(w, "insert", "", len(order), "-values", vals)
+            last_vals[key] = vals
+        elif last_vals.get(key) != vals:
+            tk_call(w, "item", iid, "-values", vals)
+            last_vals[key] = vals
+        order.append(iid)
+    if tuple(order) != tree.get_children():
+        for index, iid in enumerate(order):
+            tree.move(iid, "", index)
+
+
 def ask_extension(root: tk.Tk, title: str, prompt: str, initialvalue: str = "") -> Optional[str]:
     # simpledialog runs modal and returns a string or None.
-    return simpledialog.askstring(title, prompt, parent=root, initialvalue=initialvalue)
+    return _askstring(title, prompt, parent=root, initialvalue=initialvalue)
 
 
 def show_info(root: tk.Tk, title: str, message: str) -> None:
-    messagebox.showinfo(title, message, parent=root)
+    _showinfo(title, message, parent=root)
 
 
 def show_warning(root: tk.Tk, title: str, message: str) -> None:
-    messagebox.showwarning(title, message, parent=root)
+    _showwarning(title, message, parent=root)
 
 
 def show_error(root: tk.Tk, title: str, message: str) -> None:
-    messagebox.showerror(title, message, parent=root)
+    _showerror(title, message, parent=root)
 
 
 def ask_yes_no(root: tk.Tk, title: str, message: str) -> bool:
-    return messagebox.askyesno(title, message, parent=root)
+    return _askyesno(title, message, parent=root)
 
 
 # ---------------------------
@@ -121,13 +215,14 @@ class StatusWindow:
         self.btn_close.pack(side=tk.RIGHT)
 
     def refresh(self) -> None:
-        # Clear
-        for iid in self.tree.get_children():
-            self.tree.delete(iid)
+        tk_call = self.tree.tk.call
+        children = self.tree.get_children()
+        if children:
+            tk_call(self.tree._w, "delete", children)
 
-        rows = list(self.get_rows())
-        for ext, base, curr in rows:
-            self.tree.insert("", tk.END, values=(ext, base, curr))
+        insert_cmd = (self.tree._w, "insert", "", "end", "-values")
+        for ext, base, curr in self.get_rows():
+            tk_call(*insert_cmd, (ext, base, curr))
 
 
 # ---------------------------
@@ -139,12 +234,13 @@ class ControlPanelCallbacks:
     # Translation function. Must accept (key, **kwargs).
     tr: Callable[..., str]
     get_rows: Callable[[], Sequence[StatusRow]]
+    count_rows: Callable[[], int]
 
     add_ext: Callable[[str], None]
     delete_exts: Callable[[Sequence[str]], None]
     import_common: Callable[[Sequence[str], bool], None]
     get_baseline_progid: Callable[[str], str]
-    get_baseline_candidates: Callable[[str], Sequence[Tuple[str, str]]]
+    get_baseline_candidates: Callable[[str], Iterable[Tuple[str, str]]]
     set_baseline_manual: Callable[[str, str], None]
     get_logs: Callable[[str, int], Sequence[LogRow]]
     get_settings: Callable[[], SettingsSnapshot]
@@ -174,6 +270,31 @@ class ControlPanel:
         self.settings_auto_restore_var = tk.BooleanVar(value=True)
         self.settings_auto_start_var = tk.BooleanVar(value=False)
 
+        # Row caches for incremental Treeview updates (see _sync_tree).
+        self._row_by_ext: Dict[Hashable, str] = {}
+        self._last_vals: Dict[Hashable, tuple] = {}
+        self._log_row_by_key: Dict[Hashable, str] = {}
+        self._log_last_vals: Dict[Hashable, tuple] = {}
+        self._logs_after_id: Optional[str] = None
+        self._logs_loaded = False  # logs tab content is loaded on first view
+        self._all_logs: List[Tuple[Hashable, tuple]] = []  # (key, values), full filtered list
+        self._log_first = 0  # index of the first row in view
+        # Registry / log reads run on a worker thread (see _submit); the Tk thread polls for
+        # results, since Tk must not be called from the worker.
+        self._io_jobs: "queue.Queue[tuple]" = queue.Queue()
+        self._io_results: "deque[tuple]" = deque()
+        self._io_pending = 0  # jobs whose result has not been delivered yet
+        self._io_polling = False
+        self._io_gen: Dict[str, int] = {}  # latest request per kind; older results are dropped
+        self._io_thread: Optional[threading.Thread] = None
+        self._refresh_pending = False  # a coalesced refresh is queued (see refresh)
+        self._pending_status: Optional[str] = None  # shown instead of the row count by the next _apply_rows
+        self._applying_texts = False
+        self._dirty = False  # a refresh was skipped while hidden to tray; rerun on <Map>
+        # Language-invariant strings, resolved in apply_texts (templates keep their {n}).
+        self._t: Dict[str, str] = {}
+        self._tr_cache: Dict[str, str] = {}  # argument-free tr() results; cleared on language change
+
         self._build()
         self._load_settings()
         self.apply_texts()
@@ -203,6 +324,8 @@ class ControlPanel:
         self.notebook.add(self.tab_guard, text="")
         self.notebook.add(self.tab_logs, text="")
         self.notebook.add(self.tab_settings, text="")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self.root.bind("<Map>", self._on_map, add="+")
 
         # Guard tab
         table_frm = ttk.Frame(self.tab_guard)
@@ -269,7 +392,7 @@ class ControlPanel:
         self.lbl_log_filter.pack(side=tk.LEFT)
         self.ent_log_filter = ttk.Entry(logs_top, textvariable=self.log_filter_var, width=14)
         self.ent_log_filter.pack(side=tk.LEFT, padx=(6, 12))
-        self.ent_log_filter.bind("<Return>", lambda _e: self.refresh_logs())
+        self.ent_log_filter.bind("<KeyRelease>", lambda _e: self._schedule_refresh_logs())
 
         self.lbl_log_limit = ttk.Label(logs_top, text="")
         self.lbl_log_limit.pack(side=tk.LEFT)
@@ -281,7 +404,7 @@ class ControlPanel:
             state="readonly",
         )
         self.cmb_log_limit.pack(side=tk.LEFT, padx=(6, 12))
-        self.cmb_log_limit.bind("<<ComboboxSelected>>", lambda _e: self.refresh_logs())
+        self.cmb_log_limit.bind("<<ComboboxSelected>>", lambda _e: self._schedule_refresh_logs())
         self.btn_logs_refresh = ttk.Button(logs_top, text="", command=self.refresh_logs)
         self.btn_logs_refresh.pack(side=tk.LEFT)
 
@@ -300,9 +423,13 @@ class ControlPanel:
         self.tree_logs.column("event", width=160, anchor=tk.W, stretch=False)
         self.tree_logs.column("detail", width=520, anchor=tk.W, stretch=True)
 
-        logs_vsb = ttk.Scrollbar(logs_table, orient="vertical", command=self.tree_logs.yview)
+        # Virtualized: only the rows in view exist as Tk items. The vertical
+        # scrollbar drives a window over self._all_logs instead of the tree.
+        self.logs_vsb = logs_vsb = ttk.Scrollbar(logs_table, orient="vertical", command=self._on_logs_yview)
         logs_hsb = ttk.Scrollbar(logs_table, orient="horizontal", command=self.tree_logs.xview)
-        self.tree_logs.configure(yscrollcommand=logs_vsb.set, xscrollcommand=logs_hsb.set)
+        self.tree_logs.configure(xscrollcommand=logs_hsb.set)
+        self.tree_logs.bind("<MouseWheel>", self._on_logs_wheel)
+        self.tree_logs.bind("<Configure>", lambda _e: self._render_log_window())
 
         self.tree_logs.grid(row=0, column=0, sticky="nsew")
         logs_vsb.grid(row=0, column=1, sticky="ns")
@@ -360,6 +487,17 @@ class ControlPanel:
 
     # ---- Text refresh (for language switching) ----
     def apply_texts(self) -> None:
+        # Re-entrancy guard: configure() may fire traces that land back here.
+        if self._applying_texts:
+            return
+        self._applying_texts = True
+        try:
+            self._apply_texts()
+        finally:
+            self._applying_texts = False
+
+    def _apply_texts(self) -> None:
+        self._tr_cache.clear()  # language may have changed
         tr = self.cb.tr
         self.root.title(tr("panel_title"))
         self.lbl_title.configure(text=tr("panel_title"))
@@ -395,54 +533,136 @@ class ControlPanel:
         self.btn_settings_apply.configure(text=tr("btn_apply_settings"))
         self.lbl_settings_hint.configure(text=tr("msg_settings_hint"))
 
+        self._t = {
+            "status_count_fmt": tr("col_ext").replace("{", "{{").replace("}", "}}") + ": {n}",
+            "log_count_fmt": tr("msg_log_count", n="{n}"),
+        }
+
     # ---- helpers ----
     def _load_settings(self) -> None:
         settings = self.cb.get_settings()
         sec = float(settings.monitor_interval_sec)
-        if abs(sec - round(sec)) < 1e-6:
-            self.settings_interval_var.set(str(int(round(sec))))
-        else:
-            self.settings_interval_var.set(f"{sec:.1f}")
-        self.settings_notify_var.set(bool(settings.notifications_enabled))
-        self.settings_auto_restore_var.set(bool(settings.auto_restore_enabled))
-        self.settings_auto_start_var.set(bool(settings.auto_start_enabled))
+        text = str(int(round(sec))) if abs(sec - round(sec)) < 1e-6 else f"{sec:.1f}"
+        # Only write values that changed: every set() fires the variable's Tk traces.
+        for var, value in (
+            (self.settings_interval_var, text),
+            (self.settings_notify_var, bool(settings.notifications_enabled)),
+            (self.settings_auto_restore_var, bool(settings.auto_restore_enabled)),
+            (self.settings_auto_start_var, bool(settings.auto_start_enabled)),
+        ):
+            try:
+                if var.get() == value:
+                    continue
+            except Exception:
+                pass  # unparsable current value: overwrite it
+            var.set(value)
 
     def _selected_exts(self) -> List[str]:
-        exts: List[str] = []
-        for iid in self.tree.selection():
-            vals = self.tree.item(iid, "values")
+        tree = self.tree
+        tk_call, splitlist, w = tree.tk.call, tree.tk.splitlist, tree._w
+        # Insertion-ordered dict: dedupe while preserving selection order in one pass.
+        seen: Dict[str, None] = {}
+        for iid in tree.selection():
+            vals = splitlist(tk_call(w, "item", iid, "-values"))
             if vals:
-                exts.append(str(vals[0]))
-        # unique while preserving order
-        seen = set()
-        out: List[str] = []
-        for e in exts:
-            if e not in seen:
-                seen.add(e)
-                out.append(e)
-        return out
+                seen[str(vals[0])] = None
+        return list(seen)
+
+    def _tr_cached(self, key: str, **kwargs) -> str:
+        # For dialogs: static labels resolve once per language, formatted ones always go to tr.
+        if kwargs:
+            return self.cb.tr(key, **kwargs)
+        text = self._tr_cache.get(key)
+        if text is None:
+            text = self._tr_cache[key] = self.cb.tr(key)
+        return text
 
     def set_status(self, msg: str) -> None:
         self.status_var.set(msg)
 
     # ---- operations ----
-    def refresh(self) -> None:
-        tr = self.cb.tr
+    def _hidden(self) -> bool:
+        try:
+            return self.root.state() == "withdrawn"
+        except Exception:
+            return False
+
+    def _on_map(self, event) -> None:
+        # Bound on the root, so children's <Map> events arrive here too.
+        if event.widget is self.root and self._dirty:
+            self._dirty = False
+            self.refresh()
+
+    def refresh(self, status: Optional[str] = None) -> None:
+        """
+        Reload the guard table. Rows arrive asynchronously; `status`, if
+        given, is shown once they land instead of the row count.
+        """
+        if status is not None:
+            self._pending_status = status
+        # Nothing to show while hidden to tray: remember it and reload on <Map>.
+        if self._hidden():
+            self._dirty = True
+            return
+        self._dirty = False
+        # Coalesced: any number of requests in one event-loop turn become one reload.
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.root.after_idle(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_pending = False
+        # get_rows reads the registry per extension; keep that off the Tk thread.
+        self._submit("rows", self.cb.get_rows, self._apply_rows)
 
-        # Clear
-        for iid in self.tree.get_children():
-            self.tree.delete(iid)
+    def _apply_rows(self, rows: Sequence[StatusRow]) -> None:
+        new = {ext: (ext, base) for ext, base, _status in rows}
+        _sync_tree(self.tree, self._row_by_ext, self._last_vals, new)
 
-        rows = list(self.cb.get_rows())
+        status, self._pending_status = self._pending_status, None
+        if status is None:
+            status = self._t["status_count_fmt"].format(n=len(new))
+        self.set_status(status)
+        self._invalidate_logs()
+
+    def _logs_tab_visible(self) -> bool:
+        try:
+            return self.notebook.select() == str(self.tab_logs)
+        except Exception:
+            return False
 
-        for ext, base, _status in rows:
-            self.tree.insert("", tk.END, values=(ext, base))
+    def _invalidate_logs(self) -> None:
+        # New log entries may exist: reload now if the tab is shown, else on next view.
+        if self._logs_tab_visible():
+            self.refresh_logs()
+        else:
+            self._logs_loaded = False
 
-        self.set_status(f"{tr('col_ext')}: {len(rows)}")
-        self.refresh_logs()
+    def _on_tab_changed(self, _event=None) -> None:
+        if not self._logs_loaded and self._logs_tab_visible():
+            self.refresh_logs()
 
     def refresh_logs(self) -> None:
-        tr = self.cb.tr
+        self._schedule_refresh_logs()
+
+    def _schedule_refresh_logs(self, delay_ms: int = 150) -> None:
+        # Debounced: bursts of typing / refresh requests collapse into one reload.
+        if self._logs_after_id is not None:
+            try:
+                self.root.after_cancel(self._logs_after_id)
+            except Exception:
+                pass
+        self._logs_after_id = self.root.after(delay_ms, self._do_refresh_logs)
+
+    def _do_refresh_logs(self) -> None:
+        self._logs_after_id = None
+        if self._hidden():
+            # Reloaded via refresh() -> _invalidate_logs once the window is mapped again.
+            self._logs_loaded = False
+            self._dirty = True
+            return
+        self._logs_loaded = True
         try:
             limit = int((self.log_limit_var.get() or "200").strip())
         except Exception:
@@ -450,15 +670,117 @@ class ControlPanel:
             self.log_limit_var.set("200")
 
         ext_filter = (self.log_filter_var.get() or "").strip()
-        rows = list(self.cb.get_logs(ext_filter, limit))
+        get_logs = self.cb.get_logs
+
+        def fetch() -> List[Tuple[Hashable, tuple]]:
+            # Keyed by (time, ext, event); the trailing counter keeps identical entries apart.
+            all_logs: List[Tuple[Hashable, tuple]] = []
+            seen: Dict[Tuple[str, str, str], int] = {}
+            for ts, ext, event, detail in get_logs(ext_filter, limit):
+                base_key = (ts, ext, event)
+                n = seen.get(base_key, 0)
+                seen[base_key] = n + 1
+                all_logs.append((base_key + (n,), (ts, ext, event, detail)))
+            return all_logs
+
+        self._submit("logs", fetch, self._apply_logs)
+
+    def _apply_logs(self, all_logs: List[Tuple[Hashable, tuple]]) -> None:
+        self._all_logs = all_logs
+        self._render_log_window()
+
+        self.log_count_var.set(self._t["log_count_fmt"].format(n=len(all_logs)))
+
+    # ---- background I/O ----
+    def _submit(self, kind: str, fetch: Callable[[], Any], apply: Callable[[Any], None]) -> None:
+        gen = self._io_gen[kind] = self._io_gen.get(kind, 0) + 1
+        self._io_jobs.put((kind, gen, fetch, apply))
+        self._io_pending += 1
+        if not self._io_polling:
+            self._io_polling = True
+            self.root.after(_IO_POLL_MS, self._drain_io_results)
+        if self._io_thread is None:
+            self._io_thread = threading.Thread(target=self._io_worker, name="WinAssocGuardPanelIO", daemon=True)
+            self._io_thread.start()
+
+    def _io_worker(self) -> None:
+        jobs = self._io_jobs
+        while True:
+            kind, gen, fetch, apply = jobs.get()
+            result = error = None
+            # A superseded request is still posted (unfetched) so the Tk side can count it off.
+            if gen == self._io_gen.get(kind):
+                try:
+                    result = fetch()
+                except Exception as e:
+                    error = e
+            self._io_results.append((kind, gen, apply, result, error))
+
+    def _drain_io_results(self) -> None:
+        results = self._io_results
+        while results:
+            self._io_pending -= 1
+            try:
+                self._deliver(*results.popleft())
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+        if self._io_pending:
+            self.root.after(_IO_POLL_MS, self._drain_io_results)
+        else:
+            self._io_polling = False
 
-        for iid in self.tree_logs.get_children():
-            self.tree_logs.delete(iid)
+    def _deliver(self, kind: str, gen: int, apply: Callable[[Any], None], result: Any, error) -> None:
+        if gen != self._io_gen.get(kind):
+            return
+        if error is not None:
+            raise error  # surface through Tk's callback error handling, as before
+        apply(result)
 
-        for ts, ext, event, detail in rows:
-            self.tree_logs.insert("", tk.END, values=(ts, ext, event, detail))
+    # ---- logs virtualization ----
+    def _log_window_size(self) -> int:
+        # Rows that fit the widget (one extra covers the heading / partial row).
+        try:
+            row_h = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        except Exception:
+            row_h = 20
+        height = self.tree_logs.winfo_height()
+        if height <= 1:  # not mapped yet
+            return 40
+        return max(1, height // max(row_h, 1) + 1)
+
+    def _render_log_window(self) -> None:
+        total = len(self._all_logs)
+        size = self._log_window_size()
+        first = max(0, min(self._log_first, total - size))
+        self._log_first = first
+        _sync_tree(self.tree_logs, self._log_row_by_key, self._log_last_vals, dict(self._all_logs[first:first + size]))
+        if total > size:
+            self.logs_vsb.set(first / total, (first + size) / total)
+        else:
+            self.logs_vsb.set(0.0, 1.0)
 
-        self.log_count_var.set(tr("msg_log_count", n=len(rows)))
+    def _on_logs_yview(self, *args) -> None:
+        total = len(self._all_logs)
+        size = self._log_window_size()
+        if not args or total <= size:
+            return
+        if args[0] == "moveto":
+            first = int(round(float(args[1]) * total))
+        elif args[0] == "scroll":
+            step = size - 1 if args[2] == "pages" else 1
+            first = self._log_first + int(args[1]) * max(step, 1)
+        else:
+            return
+        if first != self._log_first:
+            self._log_first = first
+            self._render_log_window()
+
+    def _on_logs_wheel(self, event) -> str:
+        # Windows reports multiples of 120 per notch; scroll 3 rows per notch.
+        notches = -int(event.delta / 120) if event.delta else 0
+        if notches:
+            self._on_logs_yview("scroll", str(notches * 3), "units")
+        return "break"
 
     def _on_apply_settings(self) -> None:
         tr = self.cb.tr
@@ -475,6 +797,7 @@ class ControlPanel:
         )
         self.cb.update_settings(settings)
         self._load_settings()
+        self._invalidate_logs()
 
     def _on_add(self) -> None:
         tr = self.cb.tr
@@ -497,25 +820,23 @@ class ControlPanel:
         if not ask_yes_no(self.root, tr("dlg_confirm_title"), msg):
             return
         self.cb.delete_exts(exts)
-        self.refresh()
-        self.set_status(tr("msg_deleted", n=len(exts)))
+        self.refresh(status=tr("msg_deleted", n=len(exts)))
 
     def _on_delete_all(self) -> None:
         tr = self.cb.tr
-        rows = list(self.cb.get_rows())
-        n = len(rows)
+        # Only the count is needed; get_rows would also read every extension's registry state.
+        n = self.cb.count_rows()
         if n == 0:
             show_warning(self.root, tr("dlg_info_title"), tr("msg_delete_all_empty"))
             return
         if not ask_yes_no(self.root, tr("dlg_confirm_title"), tr("msg_confirm_delete_all", n=n)):
             return
         self.cb.delete_all()
-        self.refresh()
-        self.set_status(tr("msg_deleted_all", n=n))
+        self.refresh(status=tr("msg_deleted_all", n=n))
 
     def _on_import_common(self) -> None:
         tr = self.cb.tr
-        res = ask_import_common(self.root, tr)
+        res = ask_import_common(self.root, self._tr_cached)
         if res is None:
             return
         exts, capture_now = res
@@ -550,20 +871,24 @@ class ControlPanel:
         ext = str(vals[0]).strip()
         if not ext:
             return
-        tr = self.cb.tr
         current_progid = self.cb.get_baseline_progid(ext)
-        candidates = list(self.cb.get_baseline_candidates(ext))
-        progid_raw = ask_baseline_progid(
+        candidates = self.cb.get_baseline_candidates(ext)
+
+        def on_done(progid_raw: Optional[str]) -> None:
+            if progid_raw is None:
+                return
+            self.cb.set_baseline_manual(ext, progid_raw)
+            self.refresh()
+
+        # Non-blocking: the handler returns now instead of nesting an event loop until close.
+        open_baseline_picker(
             self.root,
-            tr,
+            self._tr_cached,
             ext=ext,
             current_progid=current_progid,
             candidates=candidates,
+            on_done=on_done,
         )
-        if progid_raw is None:
-            return
-        self.cb.set_baseline_manual(ext, progid_raw)
-        self.refresh()
 
 
 # ---------------------------
@@ -592,175 +917,217 @@ _COMMON_PRESETS = {
         ".mp4", ".mkv", ".avi", ".mov", ".wmv", ".webm",
     ],
 }
+# Union of every preset, sorted; static, so flattened once here.
+_ALL_COMMON_EXTS: Tuple[str, ...] = tuple(sorted({e for lst in _COMMON_PRESETS.values() for e in lst}))
+# Preset key -> row indices into _ALL_COMMON_EXTS (the import list's rows).
+_PRESET_INDICES: Dict[str, Tuple[int, ...]] = {
+    key: tuple(sorted(_ALL_COMMON_EXTS.index(e) for e in lst)) for key, lst in _COMMON_PRESETS.items()
+}
 
 
-def ask_import_common(root: tk.Tk, tr: Callable[[str], str]) -> Optional[Tuple[List[str], bool]]:
-    """Ask user to select common extensions to import.
+def _index_runs(indices: Sequence[int]) -> Tuple[Tuple[int, int], ...]:
+    """Collapse sorted indices into inclusive (first, last) runs."""
+    runs: List[Tuple[int, int]] = []
+    for i in indices:
+        if runs and runs[-1][1] == i - 1:
+            runs[-1] = (runs[-1][0], i)
+        else:
+            runs.append((i, i))
+    return tuple(runs)
 
-    Returns (selected_exts, capture_now) or None if cancelled.
+
+# Preset key -> row ranges, so a toggle is one `selection set first last` per run.
+_PRESET_RUNS: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    key: _index_runs(indices) for key, indices in _PRESET_INDICES.items()
+}
+
+
+class _ImportCommonDialog:
     """
+    The import-common dialog, built once per root and then only shown/hidden.
 
-    top = tk.Toplevel(root)
-    top.title(tr("dlg_import_common_title"))
-    top.geometry("860x640")
-    top.minsize(760, 560)
-    top.transient(root)
+    Its widget tree is the same on every open, so reopening just
+    re-translates the labels and resets the selection.
+    """
 
-    # Result
-    result: dict[str, object] = {"exts": None, "capture": True}
-    manual_exts_var = tk.StringVar()
+    def __init__(self, root: tk.Tk):
+        self.root = root
+        self._result: Optional[Tuple[List[str], bool]] = None
+        self._texts: List[Tuple[tk.Misc, str]] = []  # (widget, i18n key)
+        self._last_texts: List[str] = []
+        self._done = tk.BooleanVar(master=root, value=False)
+        self._build()
 
-    def on_cancel() -> None:
-        result["exts"] = None
+    def _text(self, widget: tk.Misc, key: str) -> tk.Misc:
+        self._texts.append((widget, key))
+        return widget
+
+    def _build(self) -> None:
+        top = self.top = tk.Toplevel(self.root)
+        top.withdraw()
+        top.geometry("860x640")
+        top.minsize(760, 560)
+        top.transient(self.root)
+        top.protocol("WM_DELETE_WINDOW", self._on_cancel)
+
+        self.manual_exts_var = tk.StringVar(master=top)
+        self.var_capture = tk.BooleanVar(master=top, value=True)
+
+        outer = ttk.Frame(top, padding=12)
+        outer.pack(fill=tk.BOTH, expand=True)
+
+        self._text(ttk.Label(outer), "dlg_import_common_desc").pack(anchor=tk.W)
+
+        manual_frm = self._text(ttk.LabelFrame(outer, padding=(10, 8)), "dlg_import_common_manual")
+        manual_frm.pack(fill=tk.X, pady=(10, 10))
+        self._text(ttk.Label(manual_frm), "dlg_import_common_manual_hint").pack(anchor=tk.W)
+        ttk.Entry(manual_frm, textvariable=self.manual_exts_var).pack(fill=tk.X, pady=(6, 0))
+
+        # Presets row
+        presets_frm = self._text(ttk.LabelFrame(outer, padding=(10, 8)), "dlg_import_common_presets")
+        presets_frm.pack(fill=tk.X, pady=(10, 10))
+
+        # Extension list: one multi-select Listbox (a single widget, filled in one insert).
+        list_frm = self._text(ttk.LabelFrame(outer, padding=(10, 8)), "dlg_import_common_list")
+        self.preset_vars: List[tk.BooleanVar] = []
+
+        lb = self.listbox = tk.Listbox(list_frm, selectmode=tk.MULTIPLE, exportselection=False, activestyle="none")
+        vsb = ttk.Scrollbar(list_frm, orient="vertical", command=lb.yview)
+        lb.configure(yscrollcommand=vsb.set)
+        lb.insert(tk.END, *_ALL_COMMON_EXTS)
+
+        def set_rows(runs: Iterable[Tuple[int, int]], value: bool) -> None:
+            op = lb.selection_set if value else lb.selection_clear
+            for first, last in runs:
+                op(first, last)
+
+        # Preset checkbuttons
+        def add_preset_toggle(parent, key: str, preset: str, col: int) -> None:
+            v = tk.BooleanVar(master=top, value=False)
+            self.preset_vars.append(v)
+            runs = _PRESET_RUNS[preset]
+
+            def on_toggle() -> None:
+                set_rows(runs, bool(v.get()))
+
+            chk = self._text(ttk.Checkbutton(parent, variable=v, command=on_toggle), key)
+            chk.grid(row=0, column=col, sticky="w", padx=(0, 12))
+
+        add_preset_toggle(presets_frm, "preset_docs", "docs", 0)
+        add_preset_toggle(presets_frm, "preset_images", "images", 1)
+        add_preset_toggle(presets_frm, "preset_code", "code", 2)
+        add_preset_toggle(presets_frm, "preset_archives", "archives", 3)
+        add_preset_toggle(presets_frm, "preset_audio", "audio", 4)
+        add_preset_toggle(presets_frm, "preset_video", "video", 5)
+
+        # Select all / none
+        btns_preset = ttk.Frame(presets_frm)
+        btns_preset.grid(row=1, column=0, columnspan=6, sticky="w", pady=(10, 0))
+
+        self._text(ttk.Button(btns_preset, command=lambda: lb.selection_set(0, tk.END)), "btn_select_all").pack(
+            side=tk.LEFT
+        )
+        self._text(ttk.Button(btns_preset, command=lambda: lb.selection_clear(0, tk.END)), "btn_select_none").pack(
+            side=tk.LEFT, padx=(8, 0)
+        )
+
+        list_frm.pack(fill=tk.BOTH, expand=True)
+        lb.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        vsb.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Options
+        opt_frm = ttk.Frame(outer)
+        opt_frm.pack(fill=tk.X, pady=(10, 8))
+        self._text(ttk.Checkbutton(opt_frm, variable=self.var_capture), "chk_capture_after_import").pack(
+            side=tk.LEFT
+        )
+
+        # Footer buttons
+        footer = ttk.Frame(outer)
+        footer.pack(fill=tk.X)
+        self._text(ttk.Button(footer, command=self._on_cancel), "btn_cancel").pack(side=tk.RIGHT)
+        self._text(ttk.Button(footer, command=self._on_ok), "btn_confirm_import").pack(side=tk.RIGHT, padx=(0, 8))
+
+    def _apply_texts(self, tr: Callable[[str], str]) -> None:
+        texts = [tr(key) for _w, key in self._texts]
+        if texts == self._last_texts:
+            return  # same language as last open
+        self._last_texts = texts
+        self.top.title(tr("dlg_import_common_title"))
+        for (w, _key), text in zip(self._texts, texts):
+            w.configure(text=text)
+
+    def _reset(self) -> None:
+        self._result = None
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.yview_moveto(0)
+        for v in self.preset_vars:
+            v.set(False)
+        self.manual_exts_var.set("")
+        self.var_capture.set(True)
+
+    def _close(self) -> None:
         try:
-            top.destroy()
+            self.top.grab_release()
+            self.top.withdraw()
         except Exception:
             pass
+        self._done.set(True)
 
-    def on_ok() -> None:
-        exts: List[str] = []
-        for ext, var in ext_vars.items():
-            try:
-                if bool(var.get()):
-                    exts.append(ext)
-            except Exception:
-                continue
-        manual_raw = (manual_exts_var.get() or "").strip()
+    def _on_cancel(self) -> None:
+        self._result = None
+        self._close()
+
+    def _on_ok(self) -> None:
+        exts = [_ALL_COMMON_EXTS[int(i)] for i in self.listbox.curselection()]
+        manual_raw = (self.manual_exts_var.get() or "").strip()
         if manual_raw:
-            for token in re.split(r"[\s,，;；]+", manual_raw):
+            seen = set(exts)
+            for token in _MANUAL_EXT_SPLIT.split(manual_raw):
                 token = token.strip().lower()
                 if not token:
                     continue
                 if not token.startswith("."):
                     token = "." + token
-                if token not in exts:
+                if token not in seen:
+                    seen.add(token)
                     exts.append(token)
-        result["exts"] = exts
         try:
-            result["capture"] = bool(var_capture.get())
+            capture = bool(self.var_capture.get())
         except Exception:
-            result["capture"] = True
+            capture = True
+        self._result = (exts, capture)
+        self._close()
+
+    def show(self, tr: Callable[[str], str]) -> Optional[Tuple[List[str], bool]]:
+        self._apply_texts(tr)
+        self._reset()
+        top = self.top
+        self._done.set(False)
+        top.deiconify()
+        top.lift()
+        # Modal-ish behavior
         try:
-            top.destroy()
+            top.grab_set()
         except Exception:
             pass
+        top.wait_variable(self._done)
+        return self._result
 
-    top.protocol("WM_DELETE_WINDOW", on_cancel)
 
-    outer = ttk.Frame(top, padding=12)
-    outer.pack(fill=tk.BOTH, expand=True)
+# One pooled import dialog per root window.
+_import_dialogs: Dict[tk.Misc, _ImportCommonDialog] = {}
 
-    lbl_desc = ttk.Label(outer, text=tr("dlg_import_common_desc"))
-    lbl_desc.pack(anchor=tk.W)
-
-    manual_frm = ttk.LabelFrame(outer, text=tr("dlg_import_common_manual"), padding=(10, 8))
-    manual_frm.pack(fill=tk.X, pady=(10, 10))
-    ttk.Label(manual_frm, text=tr("dlg_import_common_manual_hint")).pack(anchor=tk.W)
-    ent_manual = ttk.Entry(manual_frm, textvariable=manual_exts_var)
-    ent_manual.pack(fill=tk.X, pady=(6, 0))
-
-    # Presets row
-    presets_frm = ttk.LabelFrame(outer, text=tr("dlg_import_common_presets"), padding=(10, 8))
-    presets_frm.pack(fill=tk.X, pady=(10, 10))
-
-    # Prepare variables for every extension
-    all_exts: List[str] = []
-    for _k, lst in _COMMON_PRESETS.items():
-        for e in lst:
-            if e not in all_exts:
-                all_exts.append(e)
-    all_exts = sorted(all_exts)
-    ext_vars: dict[str, tk.BooleanVar] = {e: tk.BooleanVar(value=False) for e in all_exts}
-
-    def set_exts(ext_list: List[str], value: bool) -> None:
-        for e in ext_list:
-            if e in ext_vars:
-                ext_vars[e].set(value)
-
-    # Preset checkbuttons
-    def add_preset_toggle(parent, key: str, exts: List[str], col: int) -> None:
-        v = tk.BooleanVar(value=False)
-
-        def on_toggle() -> None:
-            set_exts(exts, bool(v.get()))
-
-        chk = ttk.Checkbutton(parent, text=tr(key), variable=v, command=on_toggle)
-        chk.grid(row=0, column=col, sticky="w", padx=(0, 12))
-
-    add_preset_toggle(presets_frm, "preset_docs", _COMMON_PRESETS["docs"], 0)
-    add_preset_toggle(presets_frm, "preset_images", _COMMON_PRESETS["images"], 1)
-    add_preset_toggle(presets_frm, "preset_code", _COMMON_PRESETS["code"], 2)
-    add_preset_toggle(presets_frm, "preset_archives", _COMMON_PRESETS["archives"], 3)
-    add_preset_toggle(presets_frm, "preset_audio", _COMMON_PRESETS["audio"], 4)
-    add_preset_toggle(presets_frm, "preset_video", _COMMON_PRESETS["video"], 5)
-
-    # Select all / none
-    btns_preset = ttk.Frame(presets_frm)
-    btns_preset.grid(row=1, column=0, columnspan=6, sticky="w", pady=(10, 0))
-
-    ttk.Button(btns_preset, text=tr("btn_select_all"), command=lambda: set_exts(all_exts, True)).pack(side=tk.LEFT)
-    ttk.Button(btns_preset, text=tr("btn_select_none"), command=lambda: set_exts(all_exts, False)).pack(
-        side=tk.LEFT, padx=(8, 0)
-    )
-
-    # Scrollable extension checklist
-    list_frm = ttk.LabelFrame(outer, text=tr("dlg_import_common_list"), padding=(10, 8))
-    list_frm.pack(fill=tk.BOTH, expand=True)
-
-    canvas = tk.Canvas(list_frm, highlightthickness=0)
-    vsb = ttk.Scrollbar(list_frm, orient="vertical", command=canvas.yview)
-    canvas.configure(yscrollcommand=vsb.set)
-
-    canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-    vsb.pack(side=tk.RIGHT, fill=tk.Y)
-
-    inner = ttk.Frame(canvas)
-    inner_id = canvas.create_window((0, 0), window=inner, anchor="nw")
-
-    def _on_inner_configure(_e=None):
-        canvas.configure(scrollregion=canvas.bbox("all"))
-
-    def _on_canvas_configure(e):
-        # Make inner frame width track canvas
-        try:
-            canvas.itemconfigure(inner_id, width=e.width)
-        except Exception:
-            pass
 
-    inner.bind("<Configure>", _on_inner_configure)
-    canvas.bind("<Configure>", _on_canvas_configure)
-
-    # Put checkboxes in a grid
-    cols = 6
-    for idx, ext in enumerate(all_exts):
-        r = idx // cols
-        c = idx % cols
-        chk = ttk.Checkbutton(inner, text=ext, variable=ext_vars[ext])
-        chk.grid(row=r, column=c, sticky="w", padx=(0, 12), pady=(2, 2))
-
-    # Options
-    opt_frm = ttk.Frame(outer)
-    opt_frm.pack(fill=tk.X, pady=(10, 8))
-    var_capture = tk.BooleanVar(value=True)
-    ttk.Checkbutton(opt_frm, text=tr("chk_capture_after_import"), variable=var_capture).pack(side=tk.LEFT)
-
-    # Footer buttons
-    footer = ttk.Frame(outer)
-    footer.pack(fill=tk.X)
-    ttk.Button(footer, text=tr("btn_cancel"), command=on_cancel).pack(side=tk.RIGHT)
-    ttk.Button(footer, text=tr("btn_confirm_import"), command=on_ok).pack(side=tk.RIGHT, padx=(0, 8))
-
-    # Modal-ish behavior
-    try:
-        top.grab_set()
-    except Exception:
-        pass
-    top.wait_window()
+def ask_import_common(root: tk.Tk, tr: Callable[[str], str]) -> Optional[Tuple[List[str], bool]]:
+    """Ask user to select common extensions to import.
 
-    exts_res = result.get("exts")
-    if exts_res is None:
-        return None
-    return list(exts_res), bool(result.get("capture", True))
+    Returns (selected_exts, capture_now) or None if cancelled.
+    """
+    dlg = _import_dialogs.get(root)
+    if dlg is None or not dlg.top.winfo_exists():
+        dlg = _import_dialogs[root] = _ImportCommonDialog(root)
+    return dlg.show(tr)
 
 
 def ask_baseline_progid(
@@ -768,47 +1135,75 @@ def ask_baseline_progid(
     tr: Callable[[str], str],
     ext: str,
     current_progid: str,
-    candidates: Sequence[Tuple[str, str]],
+    candidates: Iterable[Tuple[str, str]],
 ) -> Optional[str]:
     """
-    Edit baseline with an app picker.
+    Edit baseline with an app picker (blocking; see open_baseline_picker).
     Returns:
       - str: new baseline ProgId (empty string means clear)
       - None: cancelled
     """
+    result: dict[str, Optional[str]] = {"value": None}
+
+    def on_done(value: Optional[str]) -> None:
+        result["value"] = value
+
+    top = open_baseline_picker(root, tr, ext, current_progid, candidates, on_done)
+    top.wait_window()
+    return result["value"]
+
+
+def open_baseline_picker(
+    root: tk.Tk,
+    tr: Callable[[str], str],
+    ext: str,
+    current_progid: str,
+    candidates: Iterable[Tuple[str, str]],
+    on_done: Callable[[Optional[str]], None],
+) -> tk.Toplevel:
+    """
+    Non-blocking variant of ask_baseline_progid: shows the (modal) picker and
+    returns at once. `on_done` is called exactly once, after the window is
+    closed, with the same values ask_baseline_progid returns.
+    """
     top = tk.Toplevel(root)
     top.title(tr("dlg_edit_baseline_title", ext=ext))
     top.geometry("780x560")
     top.minsize(720, 500)
     top.transient(root)
 
-    result: dict[str, Optional[str]] = {"value": None}
     var_manual_input = tk.StringVar(value=(current_progid or "").strip())
     var_manual_enabled = tk.BooleanVar(value=False)
+    manual_enabled = False  # Python-side mirror of var_manual_enabled, flipped by the checkbox
 
-    def on_cancel() -> None:
-        result["value"] = None
+    done = False
+
+    def finish(value: Optional[str]) -> None:
+        nonlocal done
+        if done:
+            return
+        done = True
         try:
             top.destroy()
         except Exception:
             pass
+        on_done(value)
+
+    def on_cancel() -> None:
+        finish(None)
 
     def on_clear() -> None:
-        result["value"] = ""
-        try:
-            top.destroy()
-        except Exception:
-            pass
+        finish("")
 
     def on_confirm() -> None:
-        if bool(var_manual_enabled.get()):
+        if manual_enabled:
             manual = (var_manual_input.get() or "").strip()
             if not manual:
                 show_warning(top, tr("dlg_info_title"), tr("msg_manual_progid_required"))
                 return
-            result["value"] = manual
+            finish(manual)
         else:
-            sel = listbox.curselection()
+            sel = listbox.curselection() if listbox is not None else ()
             if not sel:
                 show_warning(top, tr("dlg_info_title"), tr("msg_pick_app_required"))
                 return
@@ -816,74 +1211,111 @@ def ask_baseline_progid(
             if idx >= len(progid_by_index):
                 show_warning(top, tr("dlg_info_title"), tr("msg_pick_app_required"))
                 return
-            result["value"] = progid_by_index[idx]
-        try:
-            top.destroy()
-        except Exception:
-            pass
+            finish(progid_by_index[idx])
 
     top.protocol("WM_DELETE_WINDOW", on_cancel)
 
+    # Grid, not pack: the manual-entry row toggles with grid_remove()/grid(), which keep its slot.
     outer = ttk.Frame(top, padding=12)
     outer.pack(fill=tk.BOTH, expand=True)
+    outer.columnconfigure(0, weight=1)
+    outer.rowconfigure(1, weight=1)
 
-    ttk.Label(outer, text=tr("dlg_edit_baseline_desc", ext=ext)).pack(anchor=tk.W)
+    ttk.Label(outer, text=tr("dlg_edit_baseline_desc", ext=ext)).grid(row=0, column=0, sticky="w")
 
     list_frm = ttk.LabelFrame(outer, text=tr("dlg_edit_baseline_candidates"), padding=(10, 8))
-    list_frm.pack(fill=tk.BOTH, expand=True, pady=(10, 8))
-
-    listbox = tk.Listbox(list_frm, activestyle="none")
-    listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-    vsb = ttk.Scrollbar(list_frm, orient="vertical", command=listbox.yview)
-    vsb.pack(side=tk.RIGHT, fill=tk.Y)
-    listbox.configure(yscrollcommand=vsb.set)
+    list_frm.grid(row=1, column=0, sticky="nsew", pady=(10, 8))
 
+    # Consumed exactly once; peek the first item to pick the empty-state layout.
+    it = iter(candidates)
+    first = next(it, None)
     progid_by_index: List[str] = []
-    for progid, display in candidates:
-        label = display or progid
-        listbox.insert(tk.END, label)
-        progid_by_index.append(progid)
-
-    current_index = -1
-    if current_progid:
-        for idx, progid in enumerate(progid_by_index):
-            if progid == current_progid:
-                current_index = idx
-                break
-
-    if not progid_by_index:
-        listbox.insert(tk.END, tr("dlg_edit_baseline_candidates_empty"))
-    elif current_index >= 0:
-        listbox.selection_set(current_index)
-        listbox.see(current_index)
-
-    listbox.bind("<Double-1>", lambda _e: on_confirm())
+    listbox: Optional[tk.Listbox] = None
+    if first is None:
+        # Nothing to pick from: a plain label instead of a one-row list with a scrollbar.
+        ttk.Label(list_frm, text=tr("dlg_edit_baseline_candidates_empty")).pack(anchor=tk.W)
+    else:
+        # Filled while still unmapped; packed afterwards so geometry is computed once.
+        listbox = tk.Listbox(list_frm, activestyle="none")
+        vsb = ttk.Scrollbar(list_frm, orient="vertical", command=listbox.yview)
+
+        def labels() -> Iterator[str]:
+            # Single pass: record each row's ProgId while yielding its label.
+            append = progid_by_index.append
+            for progid, display in itertools.chain((first,), it):
+                append(progid)
+                yield display or progid
+
+        listbox.insert(tk.END, *labels())
+
+        current_index = -1
+        if current_progid:
+            try:
+                current_index = progid_by_index.index(current_progid)  # first match, scanned in C
+            except ValueError:
+                pass
+        if current_index >= 0:
+            listbox.selection_set(current_index)
+            listbox.activate(current_index)  # keyboard navigation starts from the current row
+            # Rows within the initial `height` are on screen at scroll position 0 already.
+            if current_index >= int(listbox.cget("height")):
+                listbox.see(current_index)
+        # Wired only once the content and scroll position are final: one scrollbar update, not one per change.
+        listbox.configure(yscrollcommand=vsb.set)
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        vsb.pack(side=tk.RIGHT, fill=tk.Y)
+
+        confirm_pending = False
+
+        def on_double_click(_e=None) -> None:
+            # Coalesce stray repeat events into one confirm; a failed confirm (warning) re-arms it.
+            nonlocal confirm_pending
+            if confirm_pending:
+                return
+            confirm_pending = True
+
+            def run() -> None:
+                nonlocal confirm_pending
+                confirm_pending = False
+                if top.winfo_exists():  # not closed in the meantime
+                    on_confirm()
+
+            top.after_idle(run)
+
+        listbox.bind("<Double-1>", on_double_click)
 
     adv_chk = ttk.Checkbutton(
         outer,
         text=tr("chk_show_manual_progid"),
         variable=var_manual_enabled,
     )
-    adv_chk.pack(anchor=tk.W)
+    adv_chk.grid(row=2, column=0, sticky="w")
 
     manual_frm = ttk.LabelFrame(outer, text=tr("dlg_edit_baseline_manual"), padding=(10, 8))
+    manual_frm.grid(row=3, column=0, sticky="ew", pady=(8, 10))
     ent = ttk.Entry(manual_frm, textvariable=var_manual_input)
     ent.pack(fill=tk.X)
 
-    def sync_manual_visibility() -> None:
-        if bool(var_manual_enabled.get()):
-            manual_frm.pack(fill=tk.X, pady=(8, 10))
+    def sync_manual_visibility(enabled: bool) -> None:
+        if enabled:
+            manual_frm.grid()
             ent.focus_set()
             ent.select_range(0, tk.END)
         else:
-            manual_frm.pack_forget()
-            listbox.focus_set()
+            manual_frm.grid_remove()
+            if listbox is not None:
+                listbox.focus_set()
+
+    def on_manual_toggle() -> None:
+        nonlocal manual_enabled
+        manual_enabled = not manual_enabled
+        sync_manual_visibility(manual_enabled)
 
-    adv_chk.configure(command=sync_manual_visibility)
-    sync_manual_visibility()
+    adv_chk.configure(command=on_manual_toggle)
+    sync_manual_visibility(manual_enabled)
 
     footer = ttk.Frame(outer)
-    footer.pack(fill=tk.X)
+    footer.grid(row=4, column=0, sticky="ew")
     ttk.Button(footer, text=tr("btn_cancel"), command=on_cancel).pack(side=tk.RIGHT)
     ttk.Button(footer, text=tr("btn_confirm"), command=on_confirm).pack(side=tk.RIGHT, padx=(0, 8))
     ttk.Button(footer, text=tr("btn_clear_baseline"), command=on_clear).pack(side=tk.LEFT)
@@ -892,5 +1324,4 @@ def ask_baseline_progid(
         top.grab_set()
     except Exception:
         pass
-    top.wait_window()
-    return result["value"]
+    return top